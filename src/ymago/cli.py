@@ -6,6 +6,7 @@ for progress indication and user feedback.
 """
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 from typing import Annotated, Optional
@@ -553,6 +554,21 @@ def version_command() -> None:
     console.print(f"ymago version {__version__}")
 
 
+def _find_config_file() -> Optional[Path]:
+    """Return the first configuration file that exists on disk, if any.
+
+    Mirrors the search order used by ``load_config``.
+
+    Returns:
+        Path to the configuration file, or None when settings come from the
+        environment.
+    """
+    for path in (Path.cwd() / "ymago.toml", Path.home() / ".ymago.toml"):
+        if path.exists():
+            return path
+    return None
+
+
 @app.command("config")
 def config_command(
     show_path: Annotated[
@@ -567,15 +583,7 @@ def config_command(
             config = await load_config()
 
             if show_path:
-                # Try to find which config file was used
-                config_paths = [Path.cwd() / "ymago.toml", Path.home() / ".ymago.toml"]
-
-                config_file = None
-                for path in config_paths:
-                    if path.exists():
-                        config_file = path
-                        break
-
+                config_file = _find_config_file()
                 if config_file:
                     console.print(f"Configuration file: {config_file}")
                 else:
@@ -831,22 +839,36 @@ def _display_batch_summary(summary: BatchSummary, verbose: bool) -> None:
     """Display batch processing summary with rich formatting."""
     console.print("\n[bold green]Batch Processing Complete![/bold green]")
 
-    # Create summary table
-    table = Table(
-        title="Batch Processing Summary", show_header=True, header_style="bold magenta"
-    )
-    table.add_column("Metric", style="cyan", no_wrap=True)
-    table.add_column("Value", style="white")
+    rows = [
+        ("Total Requests", str(summary.total_requests), None),
+        ("Successful", str(summary.successful), "green"),
+        ("Failed", str(summary.failed), "red"),
+        ("Skipped", str(summary.skipped), "yellow"),
+        ("Success Rate", f"{summary.success_rate:.1f}%", None),
+        ("Processing Time", f"{summary.processing_time_seconds:.1f} seconds", None),
+        ("Throughput", f"{summary.throughput_requests_per_minute:.1f} req/min", None),
+    ]
+
+    plain_output = os.getenv("YMAGO_PLAIN_OUTPUT", "").strip().lower()
+    if plain_output in {"1", "true", "yes"}:
+        # Plain lines skip Rich's table measurement and layout passes
+        console.print("Batch Processing Summary")
+        for metric, value, _ in rows:
+            console.print(f"  {metric}: {value}")
+    else:
+        # Create summary table
+        table = Table(
+            title="Batch Processing Summary",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("Metric", style="cyan", no_wrap=True)
+        table.add_column("Value", style="white")
 
-    table.add_row("Total Requests", str(summary.total_requests))
-    table.add_row("Successful", f"[green]{summary.successful}[/green]")
-    table.add_row("Failed", f"[red]{summary.failed}[/red]")
-    table.add_row("Skipped", f"[yellow]{summary.skipped}[/yellow]")
-    table.add_row("Success Rate", f"{summary.success_rate:.1f}%")
-    table.add_row("Processing Time", f"{summary.processing_time_seconds:.1f} seconds")
-    table.add_row("Throughput", f"{summary.throughput_requests_per_minute:.1f} req/min")
+        for metric, value, style in rows:
+            table.add_row(metric, f"[{style}]{value}[/{style}]" if style else value)
 
-    console.print(table)
+        console.print(table)
 
     # Show file locations
     console.print("\n[bold]Output Files:[/bold]")
@@ -9,20 +9,32 @@ to support distributed execution, cloud functions, etc.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import os
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Awaitable, Callable, List, Set
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+)
 
 import aiofiles
+from pydantic_core import from_json
 from tenacity import (
+    AsyncRetrying,
     before_sleep_log,
-    retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
+    wait_random,
 )
 
 from ..models import (
@@ -38,6 +50,39 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Transient generation failures are retried with capped exponential backoff
+# (0.25s, 0.5s, ... up to 8s) plus up to 0.1s of jitter, so concurrent
+# workers hit by the same outage do not retry in lockstep
+_MAX_ATTEMPTS = 3
+_RETRY_BACKOFF_BASE = 0.25
+_RETRY_BACKOFF_CAP = 8.0
+_RETRY_JITTER = 0.1
+
+# Template for per-request retries; each request iterates over a copy() so
+# concurrent requests keep separate retry state
+_REQUEST_RETRYING = AsyncRetrying(
+    stop=stop_after_attempt(_MAX_ATTEMPTS),
+    wait=wait_exponential(multiplier=_RETRY_BACKOFF_BASE, max=_RETRY_BACKOFF_CAP)
+    + wait_random(0, _RETRY_JITTER),
+    retry=retry_if_exception_type((ConnectionError, TimeoutError)),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True,
+)
+
+
+def _encode_checkpoint_line(result: BatchResult) -> bytes:
+    """Serialize a batch result to one JSONL checkpoint line."""
+    # The compiled serializer emits bytes directly, skipping the str round trip
+    # of model_dump_json().encode()
+    return BatchResult.__pydantic_serializer__.to_json(result) + b"\n"
+
+
+# fdatasync is unavailable on macOS and Windows; fsync is the portable fallback
+_fdatasync: Callable[[int], None] = getattr(os, "fdatasync", os.fsync)
+
+# writev() hands the kernel a list of buffers in one call; it is POSIX-only
+_HAS_WRITEV = hasattr(os, "writev")
+
 
 class ExecutionBackend(ABC):
     """
@@ -127,6 +172,10 @@ class LocalExecutionBackend(ExecutionBackend):
         self._active_jobs = 0
         self._total_jobs_executed = 0
         self._semaphore = asyncio.Semaphore(max_concurrent_jobs)
+        self._checkpoint_batcher: Optional[_CheckpointBatcher] = None
+        self._loaded_success_ids: FrozenSet[str] = frozenset()
+        self._loaded_failed_ids: FrozenSet[str] = frozenset()
+        self._checkpoint_lock = asyncio.Lock()
 
     async def submit(self, jobs: List[GenerationJob]) -> List[GenerationResult]:
         """
@@ -265,13 +314,15 @@ class LocalExecutionBackend(ExecutionBackend):
 
         # Initialize state management
         state_file = output_dir / "_batch_state.jsonl"
-        completed_requests: Set[str] = set()
+        completed_requests: FrozenSet[str] = frozenset()
 
         # Load existing state if resuming
         if resume and state_file.exists():
-            completed_requests = await self._load_checkpoint(state_file)
+            await self._load_checkpoint(state_file)
+            completed_requests = self._loaded_success_ids
             logger.info(
-                f"Resuming batch: {len(completed_requests)} requests already completed"
+                f"Resuming batch: {len(completed_requests)} requests already "
+                f"completed, {len(self._loaded_failed_ids)} failed requests to retry"
             )
 
         # Initialize counters and rate limiter
@@ -281,52 +332,62 @@ class LocalExecutionBackend(ExecutionBackend):
         skipped = 0
 
         rate_limiter = TokenBucketRateLimiter(rate_limit)
-        semaphore = asyncio.Semaphore(concurrency)
+        # Released by each task when it finishes, so only `concurrency` tasks
+        # (and their results) are ever alive at once
+        semaphore = asyncio.BoundedSemaphore(concurrency)
+        pending: Set[asyncio.Task[None]] = set()
 
-        # Process requests concurrently
-        async def process_single_request(request: GenerationRequest) -> BatchResult:
+        async def process_single_request(request: GenerationRequest) -> None:
             """Process a single request with rate limiting and error handling."""
-            nonlocal successful, failed, skipped
-
-            # Skip if already completed (resume scenario)
-            if request.id in completed_requests:
-                skipped += 1
-                return BatchResult(
-                    request_id=request.id,
-                    status="skipped",
-                    timestamp=str(time.time()),
-                )
+            nonlocal successful, failed
 
-            # Apply rate limiting
-            await rate_limiter.acquire()
-
-            async with semaphore:
-                return await self._process_request_with_retry(
+            try:
+                # Apply rate limiting
+                await rate_limiter.acquire()
+                result = await self._process_request_with_retry(
                     request, output_dir, state_file
                 )
-
-        # Collect all requests and process them
-        request_list = []
-        async for request in requests:
-            total_requests += 1
-            request_list.append(request)
-
-        # Process requests concurrently
-        tasks = [process_single_request(req) for req in request_list]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Count results and handle exceptions
-        for result in results:
-            if isinstance(result, Exception):
+            except Exception as e:
                 failed += 1
-                logger.error(f"Unexpected error in batch processing: {result}")
-            elif isinstance(result, BatchResult):
+                logger.error(f"Unexpected error in batch processing: {e}")
+            else:
                 if result.status == "success":
                     successful += 1
                 elif result.status == "failure":
                     failed += 1
-                elif result.status == "skipped":
-                    pass  # Already counted above
+            finally:
+                semaphore.release()
+
+        # Checkpoint lines are queued to one writer task and appended in
+        # batches while the batch runs; closing the batcher flushes the rest
+        batcher = _CheckpointBatcher(state_file, max_queued=concurrency * 4)
+        await batcher.start()
+        self._checkpoint_batcher = batcher
+        try:
+            # Stream requests from the generator instead of collecting them
+            async for request in requests:
+                total_requests += 1
+
+                # Skip if already completed (resume scenario)
+                if request.id in completed_requests:
+                    skipped += 1
+                    continue
+
+                await semaphore.acquire()
+                task = asyncio.create_task(process_single_request(request))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            # Only reached with tasks still running if the batch was aborted
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            self._checkpoint_batcher = None
+            await batcher.close()
 
         # Calculate final statistics
         end_time = time.time()
@@ -354,38 +415,54 @@ class LocalExecutionBackend(ExecutionBackend):
         return summary
 
     async def _load_checkpoint(self, state_file: Path) -> Set[str]:
-        """Load completed request IDs from checkpoint file."""
+        """
+        Load completed request IDs from checkpoint file.
+
+        The file is read in one call and split into lines in memory rather
+        than iterated through the async line reader. Only request ids are
+        kept: the successful ones are returned and also stored as
+        ``_loaded_success_ids``, and the ones that only ever failed are
+        stored as ``_loaded_failed_ids``.
+        """
         completed_requests: Set[str] = set()
+        failed_requests: Set[str] = set()
 
         try:
-            async with aiofiles.open(state_file, "r") as f:
-                async for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            result = json.loads(line)
-                            if result.get("status") == "success":
-                                completed_requests.add(result["request_id"])
-                        except json.JSONDecodeError:
-                            logger.warning(f"Invalid JSON in state file: {line}")
+            async with aiofiles.open(state_file, "rb") as f:
+                data = await f.read()
+
+            for line in data.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    result = from_json(line)
+                except ValueError:
+                    # Malformed JSON or undecodable bytes
+                    logger.warning(f"Invalid JSON in state file: {line!r}")
+                    continue
+                if not isinstance(result, dict):
+                    continue
+                status = result.get("status")
+                if status == "success":
+                    completed_requests.add(result["request_id"])
+                elif status == "failure":
+                    failed_requests.add(result["request_id"])
         except FileNotFoundError:
             pass  # No checkpoint file exists yet
         except Exception as e:
             logger.error(f"Error loading checkpoint: {e}")
 
+        self._loaded_success_ids = frozenset(completed_requests)
+        # A request that failed and later succeeded is not retried
+        self._loaded_failed_ids = frozenset(failed_requests - completed_requests)
         return completed_requests
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=8),
-        retry=retry_if_exception_type((ConnectionError, TimeoutError)),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-    )
     async def _process_request_with_retry(
         self, request: GenerationRequest, output_dir: Path, state_file: Path
     ) -> BatchResult:
         """Process a single request with retry logic and atomic checkpointing."""
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Import here to avoid circular imports
@@ -396,10 +473,12 @@ class LocalExecutionBackend(ExecutionBackend):
             job = request.to_generation_job()
             config = await load_config()
 
-            result = await process_generation_job(job, config)
+            async for attempt in _REQUEST_RETRYING.copy():
+                with attempt:
+                    result = await process_generation_job(job, config)
 
             # Create batch result
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             batch_result = BatchResult(
                 request_id=request.id,
                 status="success",
@@ -415,7 +494,7 @@ class LocalExecutionBackend(ExecutionBackend):
             return batch_result
 
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             error_msg = str(e)
 
             logger.error(f"Request {request.id} failed: {error_msg}")
@@ -433,25 +512,143 @@ class LocalExecutionBackend(ExecutionBackend):
             return batch_result
 
     async def _write_checkpoint(self, state_file: Path, result: BatchResult) -> None:
-        """Atomically write a batch result to the checkpoint file."""
+        """
+        Append a batch result to the checkpoint file.
+
+        During ``process_batch`` the line is buffered and reaches disk with the
+        next batched flush; otherwise it is written immediately.
+        """
+        batcher = self._checkpoint_batcher
+        if batcher is not None and batcher.state_file == state_file:
+            await batcher.add(result)
+            return
+
         try:
-            # Use a lock to prevent concurrent writes
-            if not hasattr(self, "_checkpoint_lock"):
-                self._checkpoint_lock = asyncio.Lock()
+            line = _encode_checkpoint_line(result)
 
+            # Use a lock to prevent concurrent writes
             async with self._checkpoint_lock:
-                # Simply append to the file - aiofiles handles atomic writes
-                async with aiofiles.open(state_file, "a") as f:
-                    result_json = result.model_dump_json()
-                    await f.write(f"{result_json}\n")
-                    await f.flush()
+                # Unbuffered, so each line is a single write(2)
+                async with aiofiles.open(state_file, "ab", buffering=0) as f:
+                    await f.write(line)
 
         except Exception as e:
             logger.error(f"Failed to write checkpoint: {e}")
 
 
+class _CheckpointBatcher:
+    """
+    Append checkpoint lines to the state file from a single writer task.
+
+    Workers hand results to the writer through a bounded queue instead of
+    contending on a lock. The writer drains the queue into a list of lines
+    and appends them with a single ``os.writev`` (``os.write`` where writev
+    is unavailable) on a descriptor opened once in append mode, once
+    ``max_entries`` lines are collected or ``flush_interval`` seconds after
+    the first one, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        state_file: Path,
+        max_entries: int = 50,
+        flush_interval: float = 0.1,
+        max_queued: int = 0,
+    ):
+        self.state_file = state_file
+        self.max_entries = max_entries
+        self.flush_interval = flush_interval
+        # A None item tells the writer to flush and exit
+        self._queue: asyncio.Queue[Optional[BatchResult]] = asyncio.Queue(max_queued)
+        self._fd: Optional[int] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        """Open the state file and start the writer task."""
+        # Every checkpoint syscall runs in a worker thread, so a slow disk
+        # never stalls the event loop
+        self._fd = await asyncio.to_thread(
+            os.open, self.state_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
+        self._task = asyncio.create_task(self._run(self._fd))
+
+    async def add(self, result: BatchResult) -> None:
+        """Queue a batch result, waiting if the writer has fallen behind."""
+        await self._queue.put(result)
+
+    async def close(self) -> None:
+        """Write any queued lines, stop the writer and close the file."""
+        if self._task is not None:
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+
+        if self._fd is not None:
+            await asyncio.to_thread(os.close, self._fd)
+            self._fd = None
+
+    async def _run(self, fd: int) -> None:
+        """Collect queued results into batches and write each batch once."""
+        loop = asyncio.get_running_loop()
+        closing = False
+
+        while not closing:
+            item = await self._queue.get()
+            if item is None:
+                return
+
+            chunks = [_encode_checkpoint_line(item)]
+            count = 1
+            deadline = loop.time() + self.flush_interval
+
+            while count < self.max_entries:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+
+                if item is None:
+                    closing = True
+                    break
+                chunks.append(_encode_checkpoint_line(item))
+                count += 1
+
+            try:
+                await asyncio.to_thread(self._write_all, fd, chunks)
+            except Exception as e:
+                logger.error(f"Failed to write checkpoint: {e}")
+
+    @staticmethod
+    def _write_all(fd: int, chunks: List[bytes]) -> None:
+        """Write the lines to the state file, retrying short writes, then sync it."""
+        written = 0
+        if _HAS_WRITEV:
+            # Gathered write: no copy into one contiguous buffer. A batch holds
+            # at most max_entries lines, far below the kernel's IOV_MAX
+            written = os.writev(fd, chunks)
+
+        total = sum(len(chunk) for chunk in chunks)
+        if written < total:
+            view = memoryview(b"".join(chunks))[written:]
+            while view:
+                view = view[os.write(fd, view) :]
+        _fdatasync(fd)
+
+
 class TokenBucketRateLimiter:
-    """Token bucket rate limiter for controlling request rate."""
+    """
+    Token bucket rate limiter for controlling request rate.
+
+    Tokens are refilled lazily from the monotonic clock on each acquire, so
+    there is no background refill task and a caller that has to wait sleeps
+    exactly once for the time until its token is available.
+    """
 
     def __init__(self, requests_per_minute: int):
         self.requests_per_minute = requests_per_minute
@@ -460,25 +657,44 @@ class TokenBucketRateLimiter:
             max(1, requests_per_minute // 10)
         )  # Allow small bursts
         self.tokens: float = self.bucket_size
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self._lock = asyncio.Lock()
+        self._waiters = 0
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.tokens = min(
+            self.bucket_size, self.tokens + elapsed * self.tokens_per_second
+        )
+        self.last_update = now
 
     async def acquire(self) -> None:
         """Acquire a token, waiting if necessary."""
-        async with self._lock:
-            now = time.time()
-
-            # Add tokens based on elapsed time
-            elapsed = now - self.last_update
-            self.tokens = min(
-                self.bucket_size, self.tokens + elapsed * self.tokens_per_second
-            )
-            self.last_update = now
-
-            # Wait if no tokens available
-            if self.tokens < 1:
-                wait_time = (1 - self.tokens) / self.tokens_per_second
-                await asyncio.sleep(wait_time)
-                self.tokens = 0
-            else:
+        # Fast path: nothing awaits between the refill and the decrement, so
+        # this is race-free on a single event loop. It is skipped while any
+        # caller is queued on the lock, so waiters are served before newcomers
+        if self._waiters == 0:
+            self._refill()
+            if self.tokens >= 1:
                 self.tokens -= 1
+                return
+
+        self._waiters += 1
+        try:
+            async with self._lock:
+                self._refill()
+
+                # Wait if no tokens available
+                if self.tokens < 1:
+                    wait_time = (1 - self.tokens) / self.tokens_per_second
+                    await asyncio.sleep(wait_time)
+                    # The token that accrued while sleeping is the one
+                    # consumed, so restart the refill clock from here
+                    self.last_update = time.monotonic()
+                    self.tokens = 0
+                else:
+                    self.tokens -= 1
+        finally:
+            self._waiters -= 1
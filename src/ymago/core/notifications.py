@@ -9,7 +9,7 @@ that slow or failing webhook endpoints do not block the main generation pipeline
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Final, Literal, Optional
 
 import aiohttp
 from pydantic import BaseModel, Field
@@ -23,6 +23,12 @@ from tenacity import (
 
 logger = logging.getLogger(__name__)
 
+# Shared by every webhook request; aiohttp copies headers, so this is never mutated
+_WEBHOOK_HEADERS: Final[Dict[str, str]] = {
+    "Content-Type": "application/json",
+    "User-Agent": "ymago-webhook/1.0",
+}
+
 
 class WebhookPayload(BaseModel):
     """
@@ -92,6 +98,39 @@ class NotificationService:
         self.retry_attempts = retry_attempts
         self.retry_backoff_factor = retry_backoff_factor
 
+    @classmethod
+    def install_eager_factory(
+        cls, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> bool:
+        """
+        Install asyncio's eager task factory on the event loop.
+
+        With the eager factory, tasks created for send_notification() run
+        synchronously until their first real suspension point (the HTTP send),
+        which avoids scheduling overhead for bursts of notifications.
+
+        Args:
+            loop: Event loop to configure (defaults to the running loop)
+
+        Returns:
+            bool: True if the eager factory is active, False on Python < 3.12
+                or when the loop already has a different task factory
+        """
+        factory = getattr(asyncio, "eager_task_factory", None)
+        if factory is None:
+            return False
+
+        if loop is None:
+            loop = asyncio.get_running_loop()
+
+        # Never replace a task factory installed by the application
+        current = loop.get_task_factory()
+        if current is not None:
+            return current is factory
+
+        loop.set_task_factory(factory)
+        return True
+
     @retry(
         wait=wait_random_exponential(multiplier=1, max=30),
         stop=stop_after_attempt(3),  # Will be overridden by instance config
@@ -100,7 +139,7 @@ class NotificationService:
         reraise=True,
     )
     async def _send_webhook_request(
-        self, session: aiohttp.ClientSession, webhook_url: str, payload: WebhookPayload
+        self, session: aiohttp.ClientSession, webhook_url: str, body: bytes
     ) -> None:
         """
         Send a single webhook request with retry logic.
@@ -108,26 +147,19 @@ class NotificationService:
         Args:
             session: aiohttp client session
             webhook_url: Target webhook URL
-            payload: Webhook payload to send
+            body: Pre-serialized JSON payload, reused across retry attempts
 
         Raises:
             aiohttp.ClientError: For HTTP-related errors
             asyncio.TimeoutError: For request timeouts
         """
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "ymago-webhook/1.0",
-        }
-
-        # Convert payload to JSON
-        payload_json = payload.model_dump_json()
-
         logger.debug(f"Sending webhook to {webhook_url}")
 
         async with session.post(
             webhook_url,
-            data=payload_json,
-            headers=headers,
+            # BytesPayload sends the pre-encoded body as-is, no re-encoding
+            data=aiohttp.BytesPayload(body, content_type="application/json"),
+            headers=_WEBHOOK_HEADERS,
             timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
         ) as response:
             # Log response status
@@ -163,7 +195,9 @@ class NotificationService:
                 multiplier=self.retry_backoff_factor, max=30
             )
 
-            await self._send_webhook_request(session, webhook_url, payload)
+            # Serialize once so retries resend the same bytes
+            body = payload.model_dump_json().encode()
+            await self._send_webhook_request(session, webhook_url, body)
             logger.info(f"Webhook notification sent successfully to {webhook_url}")
 
         except Exception as e:
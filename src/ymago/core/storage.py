@@ -6,14 +6,92 @@ implementations for local filesystem storage. Future implementations can extend
 this to support cloud storage providers like AWS S3, Google Cloud Storage, etc.
 """
 
+import asyncio
+import errno
+import os
+import sys
+import uuid
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, List, Optional, Type
 from urllib.parse import urlparse
 
 import aiofiles
 import aiofiles.os
 
+# sendfile() into a regular file is only supported by the Linux kernel
+_HAS_SENDFILE = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+
+
+# Chunked-copy fallback: each upload borrows one reusable buffer, and at most
+# _BUFFER_POOL_SIZE copies per uploader hold a buffer at the same time
+_COPY_CHUNK_SIZE = 64 * 1024
+_BUFFER_POOL_SIZE = 4
+
+# Concurrent uploads share a small dedicated pool for kernel copies so bulk
+# transfers neither spawn a thread each nor starve aiofiles' default executor
+_COPY_POOL_SIZE = 4
+_copy_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_copy_pool() -> ThreadPoolExecutor:
+    """Return the shared copy pool, creating it on first use."""
+    global _copy_pool
+    if _copy_pool is None:
+        _copy_pool = ThreadPoolExecutor(
+            max_workers=_COPY_POOL_SIZE, thread_name_prefix="ymago-copy"
+        )
+    return _copy_pool
+
+
+# copy_file_range() lets the filesystem clone or copy in-kernel without
+# touching the page cache twice. It is probed on first use: kernels or
+# filesystems without it disable it for the process, while errors that only
+# concern one source/destination pair (e.g. a cross-filesystem copy) fall back
+# to sendfile() for that copy alone.
+_use_copy_file_range = hasattr(os, "copy_file_range")
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset({errno.ENOSYS, errno.EOPNOTSUPP})
+_COPY_FILE_RANGE_REJECTED = frozenset({errno.EXDEV, errno.EINVAL})
+
+
+def _kernel_copy(source_path: str, destination_path: str) -> None:
+    """
+    Copy a file without moving its bytes through user space.
+
+    Runs in a worker thread. Uses os.copy_file_range when the kernel and
+    filesystem support it, otherwise os.sendfile. A whole file is normally
+    copied by a single call instead of one read and one write per chunk.
+
+    Args:
+        source_path: Path of the file to copy
+        destination_path: Path of the file to create or overwrite
+    """
+    global _use_copy_file_range
+
+    use_copy_file_range = _use_copy_file_range
+    with open(source_path, "rb") as src, open(destination_path, "wb") as dst:
+        in_fd, out_fd = src.fileno(), dst.fileno()
+        offset = 0
+        remaining = os.fstat(in_fd).st_size
+        while remaining > 0:
+            if use_copy_file_range:
+                try:
+                    sent = os.copy_file_range(in_fd, out_fd, remaining, offset, offset)
+                except OSError as e:
+                    if e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+                        _use_copy_file_range = False
+                    elif e.errno not in _COPY_FILE_RANGE_REJECTED:
+                        raise
+                    use_copy_file_range = False
+                    continue
+            else:
+                sent = os.sendfile(out_fd, in_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+
 
 class StorageError(Exception):
     """Base exception for storage-related errors."""
@@ -179,6 +257,7 @@ class LocalStorageUploader(StorageUploader):
         base_directory: Optional[Path] = None,
         destination_url: Optional[str] = None,
         create_dirs: bool = True,
+        hardlink_on_same_fs: bool = False,
     ):
         """
         Initialize the local storage uploader.
@@ -187,6 +266,10 @@ class LocalStorageUploader(StorageUploader):
             base_directory: Base directory for all file operations (legacy parameter)
             destination_url: File URL for registry pattern (e.g., 'file:///path/to/dir')
             create_dirs: Whether to create directories if they don't exist
+            hardlink_on_same_fs: Hard-link instead of copying when the source and
+                destination are on the same filesystem. The uploaded file then
+                shares its data with the source, so later edits to the source
+                show up in the upload
         """
         if destination_url:
             parsed = urlparse(destination_url)
@@ -195,15 +278,21 @@ class LocalStorageUploader(StorageUploader):
                     "LocalStorageUploader only supports 'file://' URLs, "
                     f"got: {parsed.scheme}"
                 )
-            self.base_directory = Path(parsed.path).resolve()
+            self.base_directory = Path(os.path.abspath(parsed.path))
         elif base_directory:
-            self.base_directory = Path(base_directory).resolve()
+            # abspath is string-only; resolve() would lstat every component
+            self.base_directory = Path(os.path.abspath(os.fspath(base_directory)))
         else:
             raise ValueError(
                 "Either base_directory or destination_url must be provided"
             )
 
         self.create_dirs = create_dirs
+        self.hardlink_on_same_fs = hardlink_on_same_fs
+        # Destination paths are joined as strings to avoid per-call Path objects
+        self._base_str = str(self.base_directory)
+        self._free_buffers: List[bytearray] = []
+        self._buffer_slots: Optional[asyncio.Semaphore] = None
 
     async def upload(self, file_path: Path, destination_key: str) -> str:
         """
@@ -221,8 +310,8 @@ class LocalStorageUploader(StorageUploader):
             PermissionError: If insufficient permissions
             OSError: For other filesystem errors
         """
-        source_path = Path(file_path).resolve()
-        destination_path = self.base_directory / destination_key
+        source_path = Path(os.path.abspath(os.fspath(file_path)))
+        destination_path = os.path.join(self._base_str, destination_key)
 
         # Validate source file exists
         if not await aiofiles.os.path.exists(source_path):
@@ -230,22 +319,35 @@ class LocalStorageUploader(StorageUploader):
 
         # Create destination directory if needed
         if self.create_dirs:
-            destination_dir = destination_path.parent
+            destination_dir = os.path.dirname(destination_path)
             await aiofiles.os.makedirs(destination_dir, exist_ok=True)
 
+        # Same filesystem: publish by hard link, no data is copied
+        if self.hardlink_on_same_fs and await self._try_hardlink(
+            source_path, destination_path
+        ):
+            return destination_path
+
+        # The destination may be a link into another file's data; replace the
+        # directory entry instead of writing through it
+        if self.hardlink_on_same_fs:
+            try:
+                await aiofiles.os.remove(destination_path)
+            except FileNotFoundError:
+                pass
+
         # Perform async file copy
         try:
-            async with aiofiles.open(source_path, "rb") as src:
-                async with aiofiles.open(destination_path, "wb") as dst:
-                    # Copy in chunks to handle large files efficiently
-                    chunk_size = 64 * 1024  # 64KB chunks
-                    while True:
-                        chunk = await src.read(chunk_size)
-                        if not chunk:
-                            break
-                        await dst.write(chunk)
-
-            return str(destination_path)
+            if _HAS_SENDFILE:
+                # Kernel-side copy: one thread hop per file instead of 2N awaits
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    _get_copy_pool(), _kernel_copy, str(source_path), destination_path
+                )
+            else:
+                await self._copy_chunked(source_path, destination_path)
+
+            return destination_path
 
         except Exception as e:
             # Clean up partial file on error
@@ -263,6 +365,71 @@ class LocalStorageUploader(StorageUploader):
                     )
             raise e
 
+    async def _try_hardlink(self, source_path: Path, destination_path: str) -> bool:
+        """
+        Hard-link the source to the destination if both share a filesystem.
+
+        Args:
+            source_path: Resolved source file path
+            destination_path: Destination file path
+
+        Returns:
+            bool: True if the link was created, False if a copy is needed
+        """
+        # link(2) does not follow symlinks, so link the file they point to
+        real_source = os.path.realpath(source_path)
+        temp_path = f"{destination_path}.{uuid.uuid4().hex}.link"
+        try:
+            source_stat = await aiofiles.os.stat(real_source)
+            parent_stat = await aiofiles.os.stat(os.path.dirname(destination_path))
+            if source_stat.st_dev != parent_stat.st_dev:
+                return False
+            # Link under a temporary name and rename it over the destination,
+            # so an existing destination is replaced rather than written to
+            await aiofiles.os.link(real_source, temp_path)
+        except OSError:
+            # Missing parent, EXDEV, EPERM, ... -> copy
+            return False
+
+        try:
+            await aiofiles.os.replace(temp_path, destination_path)
+        except OSError:
+            try:
+                await aiofiles.os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+        return True
+
+    async def _copy_chunked(self, source_path: Path, destination_path: str) -> None:
+        """
+        Copy a file in chunks through a pooled, reusable read buffer.
+
+        Args:
+            source_path: Resolved source file path
+            destination_path: Destination file path
+        """
+        if self._buffer_slots is None:
+            self._buffer_slots = asyncio.Semaphore(_BUFFER_POOL_SIZE)
+
+        async with self._buffer_slots:
+            if self._free_buffers:
+                buffer = self._free_buffers.pop()
+            else:
+                buffer = bytearray(_COPY_CHUNK_SIZE)
+            view = memoryview(buffer)
+            try:
+                async with aiofiles.open(source_path, "rb") as src:
+                    async with aiofiles.open(destination_path, "wb") as dst:
+                        while True:
+                            size = await src.readinto(buffer)
+                            if not size:
+                                break
+                            await dst.write(view[:size])
+            finally:
+                view.release()
+                self._free_buffers.append(buffer)
+
     async def upload_bytes(
         self, data: bytes, destination_key: str, content_type: str
     ) -> str:
@@ -281,18 +448,18 @@ class LocalStorageUploader(StorageUploader):
             PermissionError: If insufficient permissions
             OSError: For other filesystem errors
         """
-        destination_path = self.base_directory / destination_key
+        destination_path = os.path.join(self._base_str, destination_key)
 
         # Create destination directory if needed
         if self.create_dirs:
-            destination_dir = destination_path.parent
+            destination_dir = os.path.dirname(destination_path)
             await aiofiles.os.makedirs(destination_dir, exist_ok=True)
 
         # Write bytes to file
         try:
             async with aiofiles.open(destination_path, "wb") as dst:
                 await dst.write(data)
-            return str(destination_path)
+            return destination_path
 
         except Exception as e:
             # Clean up partial file on error
@@ -312,12 +479,12 @@ class LocalStorageUploader(StorageUploader):
 
     async def exists(self, destination_key: str) -> bool:
         """Check if a file exists in local storage."""
-        file_path = self.base_directory / destination_key
+        file_path = os.path.join(self._base_str, destination_key)
         return await aiofiles.os.path.exists(file_path)
 
     async def delete(self, destination_key: str) -> bool:
         """Delete a file from local storage."""
-        file_path = self.base_directory / destination_key
+        file_path = os.path.join(self._base_str, destination_key)
 
         if not await aiofiles.os.path.exists(file_path):
             return False
@@ -165,7 +165,7 @@ class GenerationJob(BaseModel):
         """Get the appropriate file extension based on media type."""
         return ".mp4" if self.media_type == "video" else ".png"
 
-    model_config = ConfigDict(validate_assignment=True, extra="forbid")
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class GenerationResult(BaseModel):
@@ -312,7 +312,7 @@ class GenerationRequest(BaseModel):
             video_model=self.video_model,
         )
 
-    model_config = ConfigDict(validate_assignment=True, extra="forbid")
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class BatchResult(BaseModel):
@@ -361,7 +361,7 @@ class BatchResult(BaseModel):
         description="Additional metadata about the processing",
     )
 
-    model_config = ConfigDict(validate_assignment=True, extra="forbid")
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class BatchSummary(BaseModel):
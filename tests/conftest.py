@@ -6,23 +6,47 @@ used across multiple test modules.
 """
 
 import tempfile
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+from google import genai
 from rich.console import Console
+from typer.testing import CliRunner
 
+from tests.helpers import make_image_response
+from ymago.api import generate_image, generate_video
 from ymago.config import Auth, Defaults, Settings
 from ymago.models import GenerationJob, GenerationResult
 
+try:
+    import uvloop
+except ImportError:  # Optional: async tests fall back to the default loop
+    uvloop = None
 
-@pytest.fixture
+
+if uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run async tests on uvloop's libuv-based event loop when installed."""
+        return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Provide one CliRunner for the whole session; each invoke isolates its IO."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
 def sample_auth():
     """Provide a sample Auth configuration for testing."""
     return Auth(google_api_key="test_api_key_12345")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_defaults():
     """Provide sample default configuration for testing."""
     return Defaults(
@@ -31,15 +55,13 @@ def sample_defaults():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config(sample_auth, sample_defaults):
     """Provide a complete Settings configuration for testing."""
     return Settings(auth=sample_auth, defaults=sample_defaults)
 
 
-@pytest.fixture
-def sample_generation_job():
-    """Provide a sample GenerationJob for testing."""
+def _make_generation_job():
     return GenerationJob(
         prompt="A beautiful sunset over mountains",
         seed=42,
@@ -50,12 +72,31 @@ def sample_generation_job():
     )
 
 
-@pytest.fixture
-def sample_generation_result(sample_generation_job):
+@pytest.fixture(scope="session")
+def sample_video_config():
+    """Provide a Settings configuration with a video model for testing."""
+    return Settings(
+        auth=Auth(google_api_key="test_key"),
+        defaults=Defaults(
+            output_path=Path("/tmp/test"),
+            image_model="test-image-model",
+            video_model="test-video-model",
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_generation_job():
+    """Provide a sample GenerationJob for testing."""
+    return _make_generation_job()
+
+
+@pytest.fixture(scope="session")
+def sample_generation_result():
     """Provide a sample GenerationResult for testing."""
     return GenerationResult(
         local_path=Path("/tmp/test_output/test_image.png"),
-        job=sample_generation_job,
+        job=_make_generation_job(),
         file_size_bytes=1024000,
         generation_time_seconds=2.5,
         metadata={
@@ -69,13 +110,39 @@ def sample_generation_result(sample_generation_job):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_video_result():
+    """Provide a sample video GenerationResult for testing."""
+    job = GenerationJob(
+        prompt="Test video prompt",
+        media_type="video",
+        output_filename="test_video",
+        video_model="test-video-model",
+    )
+    return GenerationResult(
+        local_path=Path("/tmp/test/test_video.mp4"),
+        job=job,
+        metadata={"duration": "5s", "resolution": "1920x1080"},
+        file_size_bytes=1024000,
+        generation_time_seconds=15.5,
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_image_bytes():
     """Provide sample image data for testing."""
     # Create a small fake PNG header for testing
     return b"\x89PNG\r\n\x1a\n" + b"fake_image_data" * 100
 
 
+@pytest.fixture(scope="session")
+def fake_image_path(tmp_path_factory):
+    """Provide the path of a small image file written once per session."""
+    path = tmp_path_factory.mktemp("images") / "source.png"
+    path.write_bytes(b"fake_image_data")
+    return str(path)
+
+
 @pytest.fixture
 def temp_directory():
     """Provide a temporary directory for testing file operations."""
@@ -86,27 +153,67 @@ def temp_directory():
 @pytest.fixture
 def mock_genai_client():
     """Provide a mocked Google Generative AI client."""
-    mock_client = MagicMock()
-    mock_response = MagicMock()
+    mock_client = Mock(spec=genai.Client)
+    mock_client.models.generate_content.return_value = make_image_response(
+        b"fake_image_data"
+    )
 
-    # Set up the response structure
-    mock_candidate = MagicMock()
-    mock_candidate.finish_reason = "STOP"
+    return mock_client
 
-    mock_content = MagicMock()
-    mock_part = MagicMock()
-    mock_inline_data = MagicMock()
-    mock_inline_data.data = b"fake_image_data"
 
-    mock_part.inline_data = mock_inline_data
-    mock_content.parts = [mock_part]
-    mock_candidate.content = mock_content
+@dataclass
+class ApiMocks:
+    """Handles to the mocks installed by the ``api_mocks`` fixture."""
 
-    mock_response.candidates = [mock_candidate]
+    client: Mock
+    to_thread: AsyncMock
+    sleep: AsyncMock
 
-    mock_client.models.generate_content.return_value = mock_response
 
-    return mock_client
+@pytest.fixture
+def api_mocks(monkeypatch):
+    """Patch ``genai.Client`` and ``asyncio.to_thread`` as seen by ``ymago.api``.
+
+    The tenacity retry waits on ``generate_image`` and ``generate_video`` are
+    replaced too, so retried calls do not sleep through their backoff.
+    """
+    client = Mock(spec=genai.Client, return_value=Mock(spec=genai.Client))
+    mocks = ApiMocks(client=client, to_thread=AsyncMock(), sleep=AsyncMock())
+    monkeypatch.setattr("ymago.api.genai.Client", mocks.client)
+    monkeypatch.setattr("ymago.api.asyncio.to_thread", mocks.to_thread)
+    for func in (generate_image, generate_video):
+        monkeypatch.setattr(func.retry, "sleep", mocks.sleep)  # type: ignore[attr-defined]
+    return mocks
+
+
+@dataclass
+class CliMocks:
+    """Handles to the mocks installed by the ``cli_mocks`` fixture."""
+
+    load_config: AsyncMock
+    process_job: AsyncMock
+
+
+@pytest.fixture(scope="module")
+def _cli_stubs():
+    """Build the ``ymago.cli`` stubs once per module; see ``cli_mocks``."""
+    return CliMocks(load_config=AsyncMock(), process_job=AsyncMock())
+
+
+@pytest.fixture
+def cli_mocks(monkeypatch, _cli_stubs, sample_config):
+    """Patch ``load_config`` and ``process_generation_job`` as seen by ``ymago.cli``.
+
+    The patches only last for the requesting test. The mocks are shared by the
+    module and reset before each test; ``load_config`` returns
+    ``sample_config`` unless a test overrides it.
+    """
+    for mock in (_cli_stubs.load_config, _cli_stubs.process_job):
+        mock.reset_mock(return_value=True, side_effect=True)
+    _cli_stubs.load_config.return_value = sample_config
+    monkeypatch.setattr("ymago.cli.load_config", _cli_stubs.load_config)
+    monkeypatch.setattr("ymago.cli.process_generation_job", _cli_stubs.process_job)
+    return _cli_stubs
 
 
 @pytest.fixture
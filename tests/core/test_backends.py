@@ -82,13 +82,11 @@ class TestLocalExecutionBackend:
         assert backend._active_jobs == 0
         assert backend._total_jobs_executed == 0
 
-    @pytest.mark.asyncio
     async def test_submit_empty_jobs_list(self, backend):
         """Test submitting an empty jobs list raises ValueError."""
         with pytest.raises(ValueError, match="Jobs list cannot be empty"):
             await backend.submit([])
 
-    @pytest.mark.asyncio
     async def test_submit_single_job_success(self, backend, mock_config, sample_jobs):
         """Test successful submission of a single job."""
         job = sample_jobs[0]
@@ -113,7 +111,7 @@ class TestLocalExecutionBackend:
                 assert results[0].get_metadata("execution_backend") == "local"
                 mock_process_job.assert_called_once_with(job, mock_config)
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_submit_multiple_jobs_with_concurrency(
         self, backend, mock_config, sample_jobs
     ):
@@ -156,7 +154,6 @@ class TestLocalExecutionBackend:
                 # Max concurrent should not exceed the limit
                 assert max_concurrent <= backend.max_concurrent_jobs
 
-    @pytest.mark.asyncio
     async def test_submit_with_job_failure(self, backend, mock_config, sample_jobs):
         """Test handling of job failures during submission."""
 
@@ -179,7 +176,6 @@ class TestLocalExecutionBackend:
                 with pytest.raises(RuntimeError, match="Processing failed"):
                     await backend.submit(sample_jobs)
 
-    @pytest.mark.asyncio
     async def test_submit_with_unexpected_result_type(
         self, backend, mock_config, sample_jobs
     ):
@@ -208,7 +204,6 @@ class TestLocalExecutionBackend:
                 ):
                     await backend.submit(sample_jobs)
 
-    @pytest.mark.asyncio
     async def test_get_status(self, backend):
         """Test getting backend status."""
         status = await backend.get_status()
@@ -219,7 +214,6 @@ class TestLocalExecutionBackend:
         assert status["total_jobs_executed"] == 0
         assert status["available_slots"] == 2
 
-    @pytest.mark.asyncio
     async def test_get_status_during_execution(self, backend, mock_config, sample_jobs):
         """Test getting status while jobs are executing."""
         status_during_execution = None
@@ -254,7 +248,6 @@ class TestLocalExecutionBackend:
                 assert final_status["active_jobs"] == 0
                 assert final_status["total_jobs_executed"] == 2
 
-    @pytest.mark.asyncio
     async def test_execution_metadata_added(self, backend, mock_config):
         """Test that execution metadata is properly added to results."""
         job = GenerationJob(prompt="Test prompt", output_filename="test")
@@ -279,7 +272,6 @@ class TestLocalExecutionBackend:
                 assert result.get_metadata("execution_backend") == "local"
                 assert result.get_metadata("execution_time") is not None
 
-    @pytest.mark.asyncio
     async def test_concurrent_submission_tracking(self, backend, mock_config):
         """Test that job execution count is tracked correctly."""
         jobs = [
@@ -311,7 +303,6 @@ class TestLocalExecutionBackend:
                 status2 = await backend.get_status()
                 assert status2["total_jobs_executed"] == 5
 
-    @pytest.mark.asyncio
     async def test_backend_handles_asyncio_cancellation(
         self, backend, mock_config, sample_jobs
     ):
@@ -341,7 +332,7 @@ class TestLocalExecutionBackend:
                 with pytest.raises(asyncio.CancelledError):
                     await task
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_backend_respects_semaphore(self, backend, mock_config):
         """Test that backend properly uses semaphore for concurrency control."""
         execution_order = []
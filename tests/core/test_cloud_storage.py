@@ -59,7 +59,6 @@ class TestS3StorageBackend:
             with pytest.raises(ImportError, match="AWS S3 support requires 'aioboto3'"):
                 S3StorageBackend(destination_url="s3://test-bucket/path/")
 
-    @pytest.mark.asyncio
     async def test_upload_file_success(self):
         """Test successful file upload to S3."""
         mock_s3_client = AsyncMock()
@@ -98,7 +97,6 @@ class TestS3StorageBackend:
             finally:
                 tmp_path.unlink()
 
-    @pytest.mark.asyncio
     async def test_upload_bytes_success(self):
         """Test successful bytes upload to S3."""
         mock_s3_client = AsyncMock()
@@ -131,7 +129,7 @@ class TestS3StorageBackend:
                 ContentType="image/jpeg",
             )
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_upload_with_s3_error(self):
         """Test upload failure due to S3 error."""
         mock_s3_client = AsyncMock()
@@ -163,7 +161,6 @@ class TestS3StorageBackend:
             finally:
                 tmp_path.unlink()
 
-    @pytest.mark.asyncio
     async def test_exists_true(self):
         """Test exists method when file exists."""
         mock_s3_client = AsyncMock()
@@ -187,7 +184,6 @@ class TestS3StorageBackend:
                 Bucket="test-bucket", Key="uploads/test-image.jpg"
             )
 
-    @pytest.mark.asyncio
     async def test_exists_false(self):
         """Test exists method when file doesn't exist."""
         mock_s3_client = AsyncMock()
@@ -248,7 +244,6 @@ class TestGCSStorageBackend:
             ):
                 GCSStorageBackend(destination_url="gs://test-bucket/path/")
 
-    @pytest.mark.asyncio
     async def test_upload_bytes_success(self):
         """Test successful bytes upload to GCS."""
         mock_storage = AsyncMock()
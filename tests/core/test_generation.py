@@ -27,8 +27,9 @@ class TestGenerateFilename:
 
     def test_generate_filename_with_custom_filename(self, sample_generation_job):
         """Test filename generation with custom filename."""
-        job = sample_generation_job
-        job.output_filename = "custom_name"
+        job = sample_generation_job.model_copy(
+            update={"output_filename": "custom_name"}
+        )
 
         filename = _generate_filename(job)
 
@@ -80,7 +81,6 @@ class TestGenerateFilename:
 class TestCreateTempFile:
     """Test the _create_temp_file function."""
 
-    @pytest.mark.asyncio
     async def test_create_temp_file_success(self, sample_image_bytes):
         """Test successful temporary file creation."""
         with (
@@ -104,7 +104,6 @@ class TestCreateTempFile:
             mock_close.assert_called_once_with(mock_fd)
             mock_file.write.assert_called_once_with(sample_image_bytes)
 
-    @pytest.mark.asyncio
     async def test_create_temp_file_write_error(self, sample_image_bytes):
         """Test temporary file creation handles write errors."""
         with (
@@ -133,7 +132,6 @@ class TestCreateTempFile:
 class TestProcessGenerationJob:
     """Test the process_generation_job function."""
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_success(
         self, sample_generation_job, sample_config, sample_image_bytes
     ):
@@ -208,7 +206,6 @@ class TestProcessGenerationJob:
             # Verify cleanup
             mock_remove.assert_called_once_with(temp_path)
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_api_error(
         self, sample_generation_job, sample_config
     ):
@@ -224,7 +221,6 @@ class TestProcessGenerationJob:
             with pytest.raises(GenerationError, match="Generation job failed"):
                 await process_generation_job(sample_generation_job, sample_config)
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_storage_error(
         self, sample_generation_job, sample_config, sample_image_bytes
     ):
@@ -261,7 +257,6 @@ class TestProcessGenerationJob:
             # Verify cleanup still happens
             mock_remove.assert_called_once_with(temp_path)
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_temp_file_error(
         self, sample_generation_job, sample_config, sample_image_bytes
     ):
@@ -281,7 +276,6 @@ class TestProcessGenerationJob:
             with pytest.raises(GenerationError, match="Generation job failed"):
                 await process_generation_job(sample_generation_job, sample_config)
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_cleanup_on_error(
         self, sample_generation_job, sample_config, sample_image_bytes
     ):
@@ -316,13 +310,12 @@ class TestProcessGenerationJob:
             # Verify cleanup was attempted
             mock_remove.assert_called_once_with(temp_path)
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_from_local_file(
         self, sample_generation_job, sample_config, sample_image_bytes
     ):
         """Test generation job processing with a local file as source image."""
         local_image_path = "/path/to/local/image.png"
-        sample_generation_job.from_image = local_image_path
+        job = sample_generation_job.model_copy(update={"from_image": local_image_path})
 
         with (
             patch(
@@ -348,7 +341,7 @@ class TestProcessGenerationJob:
             mock_uploader_class.return_value = mock_uploader
             mock_getsize.return_value = len(sample_image_bytes)
 
-            await process_generation_job(sample_generation_job, sample_config)
+            await process_generation_job(job, sample_config)
 
             mock_read_image.assert_called_once()
             # Get the path argument from the call
@@ -360,7 +353,6 @@ class TestProcessGenerationJob:
             # Check that the local image bytes were passed to the generator
             assert mock_generate.call_args[1]["source_image"] == b"local_image_bytes"
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_file_size_calculation(
         self, sample_generation_job, sample_config
     ):
@@ -403,7 +395,6 @@ class TestProcessGenerationJob:
 class TestGenerationWithCloudStorage:
     """Test generation process with cloud storage backends."""
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_with_s3_destination(
         self, sample_generation_job, sample_config, sample_image_bytes
     ):
@@ -417,6 +408,8 @@ class TestGenerationWithCloudStorage:
             patch("ymago.core.generation.aiofiles.os.remove"),
             patch("ymago.core.generation.aiofiles.os.path.getsize") as mock_getsize,
             patch("ymago.core.generation.aiofiles.os.path.exists") as mock_exists,
+            # Keep the metadata sidecar from landing in a relative "s3:/" dir
+            patch("ymago.core.generation.write_metadata", new_callable=AsyncMock),
         ):
             # Mock API call
             mock_generate.return_value = sample_image_bytes
@@ -434,14 +427,15 @@ class TestGenerationWithCloudStorage:
             mock_getsize.return_value = 1024
             mock_exists.return_value = True
 
-            # Configure cloud storage settings
-            sample_config.cloud_storage.aws_access_key_id = "test-key"
-            sample_config.cloud_storage.aws_secret_access_key = "test-secret"
-            sample_config.cloud_storage.aws_region = "us-east-1"
+            # Configure cloud storage settings on a copy of the shared config
+            config = sample_config.model_copy(deep=True)
+            config.cloud_storage.aws_access_key_id = "test-key"
+            config.cloud_storage.aws_secret_access_key = "test-secret"
+            config.cloud_storage.aws_region = "us-east-1"
 
             result = await process_generation_job(
                 sample_generation_job,
-                sample_config,
+                config,
                 destination_url="s3://test-bucket/uploads/",
             )
 
@@ -458,7 +452,6 @@ class TestGenerationWithCloudStorage:
             assert result.metadata["storage_backend"] == "cloud"
             assert "job_id" in result.metadata
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_with_gcs_destination(
         self, sample_generation_job, sample_config, sample_image_bytes
     ):
@@ -472,6 +465,8 @@ class TestGenerationWithCloudStorage:
             patch("ymago.core.generation.aiofiles.os.remove"),
             patch("ymago.core.generation.aiofiles.os.path.getsize") as mock_getsize,
             patch("ymago.core.generation.aiofiles.os.path.exists") as mock_exists,
+            # Keep the metadata sidecar from landing in a relative "gs:/" dir
+            patch("ymago.core.generation.write_metadata", new_callable=AsyncMock),
         ):
             # Mock API call
             mock_generate.return_value = sample_image_bytes
@@ -489,14 +484,15 @@ class TestGenerationWithCloudStorage:
             mock_getsize.return_value = 1024
             mock_exists.return_value = True
 
-            # Configure GCS settings
-            sample_config.cloud_storage.gcp_service_account_path = Path(
+            # Configure GCS settings on a copy of the shared config
+            config = sample_config.model_copy(deep=True)
+            config.cloud_storage.gcp_service_account_path = Path(
                 "/path/to/service-account.json"
             )
 
             await process_generation_job(
                 sample_generation_job,
-                sample_config,
+                config,
                 destination_url="gs://test-bucket/uploads/",
             )
 
@@ -507,7 +503,6 @@ class TestGenerationWithCloudStorage:
             )
             mock_backend.upload.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_with_r2_destination_missing_credentials(
         self, sample_generation_job, sample_config, sample_image_bytes
     ):
@@ -541,7 +536,6 @@ class TestGenerationWithCloudStorage:
 class TestGenerationWithWebhooks:
     """Test generation process with webhook notifications."""
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_with_webhook_success(
         self, sample_generation_job, sample_config, sample_image_bytes
     ):
@@ -614,7 +608,6 @@ class TestGenerationWithWebhooks:
             assert payload.processing_time_seconds > 0
             assert payload.file_size_bytes == 1024
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_with_webhook_failure_notification(
         self, sample_generation_job, sample_config, sample_image_bytes
     ):
@@ -664,7 +657,6 @@ class TestGenerationWithWebhooks:
             assert payload.job_status == "failure"
             assert payload.error_message == "API error"
 
-    @pytest.mark.asyncio
     async def test_process_generation_job_without_webhook_session(
         self, sample_generation_job, sample_config, sample_image_bytes
     ):
@@ -72,7 +72,6 @@ class TestMetadataModel:
 class TestDownloadImage:
     """Test the download_image function."""
 
-    @pytest.mark.asyncio
     async def test_download_image_success(self):
         """Test successful image download."""
         mock_response = Mock()
@@ -88,13 +87,11 @@ class TestDownloadImage:
             assert result == b"fake_image_data"
             mock_get.assert_called_once_with("https://example.com/image.jpg")
 
-    @pytest.mark.asyncio
     async def test_download_image_invalid_url(self):
         """Test download with invalid URL."""
         with pytest.raises(DownloadError, match="Invalid URL format"):
             await download_image("not-a-url")
 
-    @pytest.mark.asyncio
     async def test_download_image_http_error(self):
         """Test download with HTTP error."""
         mock_response = Mock()
@@ -106,7 +103,6 @@ class TestDownloadImage:
             with pytest.raises(DownloadError, match="HTTP 404"):
                 await download_image("https://example.com/image.jpg")
 
-    @pytest.mark.asyncio
     async def test_download_image_invalid_content_type(self):
         """Test download with invalid content type."""
         mock_response = Mock()
@@ -121,7 +117,6 @@ class TestDownloadImage:
             result = await download_image("https://example.com/image.jpg")
             assert result == b"fake_html_data"
 
-    @pytest.mark.asyncio
     async def test_download_image_network_error(self):
         """Test download with network error."""
         with patch("aiohttp.ClientSession.get") as mock_get:
@@ -130,7 +125,6 @@ class TestDownloadImage:
             with pytest.raises(DownloadError, match="Network error"):
                 await download_image("https://example.com/image.jpg")
 
-    @pytest.mark.asyncio
     async def test_download_image_timeout(self):
         """Test download with timeout."""
         with patch("aiohttp.ClientSession.get") as mock_get:
@@ -143,7 +137,6 @@ class TestDownloadImage:
 class TestWriteMetadata:
     """Test the write_metadata function."""
 
-    @pytest.mark.asyncio
     async def test_write_metadata_success(self):
         """Test successful metadata writing."""
         metadata = MetadataModel(
@@ -166,7 +159,6 @@ class TestWriteMetadata:
             assert saved_metadata["model_name"] == "test-model"
             assert saved_metadata["seed"] == 42
 
-    @pytest.mark.asyncio
     async def test_write_metadata_with_validation(self):
         """Test metadata writing with Pydantic validation."""
         metadata = MetadataModel(
@@ -187,7 +179,6 @@ class TestWriteMetadata:
             assert "timestamp_utc" in saved_metadata
             assert saved_metadata["timestamp_utc"] is not None
 
-    @pytest.mark.asyncio
     async def test_write_metadata_permission_error(self):
         """Test metadata writing with permission error."""
         metadata = MetadataModel(
@@ -215,7 +206,6 @@ class TestWriteMetadata:
 class TestReadImageFromPath:
     """Test the read_image_from_path function."""
 
-    @pytest.mark.asyncio
     async def test_read_image_from_path_success(self):
         """Test successful image reading from a path."""
         with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as temp_file:
@@ -228,7 +218,6 @@ class TestReadImageFromPath:
         finally:
             temp_path.unlink()
 
-    @pytest.mark.asyncio
     async def test_read_image_from_path_not_found(self):
         """Test reading a non-existent image file."""
         non_existent_path = Path("non_existent_file.png")
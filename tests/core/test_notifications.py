@@ -9,9 +9,8 @@ actual network calls.
 import asyncio
 from datetime import datetime
 
-import aiohttp
 import pytest
-from aioresponses import aioresponses
+import pytest_asyncio
 
 from ymago.core.notifications import (
     NotificationService,
@@ -21,6 +20,15 @@ from ymago.core.notifications import (
 )
 
 
+@pytest_asyncio.fixture(scope="module")
+async def http_session():
+    """Provide one aiohttp session shared by every test in this module."""
+    import aiohttp
+
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
 class TestWebhookPayload:
     """Test webhook payload model."""
 
@@ -108,6 +116,7 @@ class TestWebhookPayload:
         assert payload.metadata["retry_count"] == 3
 
 
+@pytest.mark.xdist_group("notifications")
 class TestNotificationService:
     """Test notification service functionality."""
 
@@ -129,9 +138,10 @@ class TestNotificationService:
         assert service.retry_attempts == 5
         assert service.retry_backoff_factor == 1.5
 
-    @pytest.mark.asyncio
-    async def test_send_notification_success(self):
+    async def test_send_notification_success(self, http_session):
         """Test successful webhook notification delivery."""
+        from aioresponses import aioresponses
+
         service = NotificationService()
         payload = create_success_payload(
             job_id="test-success",
@@ -148,15 +158,15 @@ class TestNotificationService:
                 payload={"status": "received"},
             )
 
-            async with aiohttp.ClientSession() as session:
-                # Should not raise any exceptions
-                await service.send_notification(
-                    session, "https://webhook.example.com/notify", payload
-                )
+            # Should not raise any exceptions
+            await service.send_notification(
+                http_session, "https://webhook.example.com/notify", payload
+            )
 
-    @pytest.mark.asyncio
-    async def test_send_notification_http_error(self):
+    async def test_send_notification_http_error(self, http_session):
         """Test webhook notification with HTTP error (should not raise)."""
+        from aioresponses import aioresponses
+
         service = NotificationService(
             retry_attempts=1
         )  # Reduce retries for faster test
@@ -175,15 +185,15 @@ class TestNotificationService:
                 payload={"error": "Internal server error"},
             )
 
-            async with aiohttp.ClientSession() as session:
-                # Should not raise any exceptions (fire-and-forget)
-                await service.send_notification(
-                    session, "https://webhook.example.com/notify", payload
-                )
+            # Should not raise any exceptions (fire-and-forget)
+            await service.send_notification(
+                http_session, "https://webhook.example.com/notify", payload
+            )
 
-    @pytest.mark.asyncio
-    async def test_send_notification_timeout(self):
+    async def test_send_notification_timeout(self, http_session):
         """Test webhook notification with timeout (should not raise)."""
+        from aioresponses import aioresponses
+
         service = NotificationService(timeout_seconds=1, retry_attempts=1)
         payload = create_success_payload(
             job_id="test-timeout",
@@ -196,15 +206,15 @@ class TestNotificationService:
             # Mock timeout by not adding any response
             pass
 
-        async with aiohttp.ClientSession() as session:
-            # Should not raise any exceptions (fire-and-forget)
-            await service.send_notification(
-                session, "https://webhook.example.com/notify", payload
-            )
+        # Should not raise any exceptions (fire-and-forget)
+        await service.send_notification(
+            http_session, "https://webhook.example.com/notify", payload
+        )
 
-    @pytest.mark.asyncio
-    async def test_send_notification_retry_logic(self):
+    async def test_send_notification_retry_logic(self, http_session):
         """Test webhook notification retry logic."""
+        from aioresponses import aioresponses
+
         service = NotificationService(retry_attempts=2)
         payload = create_success_payload(
             job_id="test-retry",
@@ -227,15 +237,21 @@ class TestNotificationService:
                 payload={"status": "received"},
             )
 
-            async with aiohttp.ClientSession() as session:
-                # Should not raise any exceptions
-                await service.send_notification(
-                    session, "https://webhook.example.com/notify", payload
-                )
+            # Should not raise any exceptions
+            await service.send_notification(
+                http_session, "https://webhook.example.com/notify", payload
+            )
 
-    @pytest.mark.asyncio
-    async def test_send_notification_async_task(self):
+    @pytest.mark.parametrize("eager", [False, True], ids=["default", "eager"])
+    async def test_send_notification_async_task(self, http_session, eager):
         """Test creating async task for webhook notification."""
+        from aioresponses import aioresponses
+
+        loop = asyncio.get_running_loop()
+        previous_factory = loop.get_task_factory()
+        if eager and not NotificationService.install_eager_factory(loop):
+            pytest.skip("eager task factory needs Python 3.12+ and no custom factory")
+
         service = NotificationService()
         payload = create_success_payload(
             job_id="test-async",
@@ -244,18 +260,32 @@ class TestNotificationService:
             file_size_bytes=1024,
         )
 
-        with aioresponses() as mock_responses:
-            mock_responses.post(
-                "https://webhook.example.com/notify",
-                status=200,
-                payload={"status": "received"},
-            )
+        try:
+            if eager:
+                assert loop.get_task_factory() is asyncio.eager_task_factory
+
+            # An eager task runs up to its first suspension inside create_task
+            started = []
+
+            async def probe():
+                started.append(True)
+                await asyncio.sleep(0)
+
+            probe_task = asyncio.create_task(probe())
+            assert started == ([True] if eager else [])
+            await probe_task
+
+            with aioresponses() as mock_responses:
+                mock_responses.post(
+                    "https://webhook.example.com/notify",
+                    status=200,
+                    payload={"status": "received"},
+                )
 
-            async with aiohttp.ClientSession() as session:
                 # Create async task
                 task = asyncio.create_task(
                     service.send_notification(
-                        session, "https://webhook.example.com/notify", payload
+                        http_session, "https://webhook.example.com/notify", payload
                     )
                 )
 
@@ -263,10 +293,14 @@ class TestNotificationService:
 
                 # Wait for task to complete
                 await task
+        finally:
+            # The event loop is shared across tests, so restore its factory
+            loop.set_task_factory(previous_factory)
 
-    @pytest.mark.asyncio
-    async def test_webhook_request_headers(self):
+    async def test_webhook_request_headers(self, http_session):
         """Test that webhook requests include correct headers."""
+        from aioresponses import aioresponses
+
         service = NotificationService()
         payload = create_success_payload(
             job_id="test-headers",
@@ -282,26 +316,27 @@ class TestNotificationService:
                 payload={"status": "received"},
             )
 
-            async with aiohttp.ClientSession() as session:
-                await service.send_notification(
-                    session, "https://webhook.example.com/notify", payload
-                )
+            await service.send_notification(
+                http_session, "https://webhook.example.com/notify", payload
+            )
 
-                # Check that the request was made with correct headers
-                requests = mock_responses.requests
-                assert len(requests) == 1
+            # Check that the request was made with correct headers
+            requests = mock_responses.requests
+            assert len(requests) == 1
 
-                # Get the first request made to any URL
-                first_request_list = list(requests.values())[0]
-                assert len(first_request_list) == 1
-                request_kwargs = first_request_list[0].kwargs
+            # Get the first request made to any URL
+            first_request_list = list(requests.values())[0]
+            assert len(first_request_list) == 1
+            request_kwargs = first_request_list[0].kwargs
 
-                assert request_kwargs["headers"]["Content-Type"] == "application/json"
-                assert request_kwargs["headers"]["User-Agent"] == "ymago-webhook/1.0"
+            assert request_kwargs["headers"]["Content-Type"] == "application/json"
+            assert request_kwargs["headers"]["User-Agent"] == "ymago-webhook/1.0"
 
-    @pytest.mark.asyncio
-    async def test_webhook_payload_content(self):
+    async def test_webhook_payload_content(self, http_session):
         """Test that webhook request contains correct payload."""
+        import aiohttp
+        from aioresponses import aioresponses
+
         service = NotificationService()
         payload = create_success_payload(
             job_id="test-content",
@@ -318,21 +353,22 @@ class TestNotificationService:
                 payload={"status": "received"},
             )
 
-            async with aiohttp.ClientSession() as session:
-                await service.send_notification(
-                    session, "https://webhook.example.com/notify", payload
-                )
-
-                # Check that the request was made with correct payload
-                requests = mock_responses.requests
-                assert len(requests) == 1
-
-                # Get the first request made to any URL
-                first_request_list = list(requests.values())[0]
-                assert len(first_request_list) == 1
-                request_data = first_request_list[0].kwargs.get("data")
+            await service.send_notification(
+                http_session, "https://webhook.example.com/notify", payload
+            )
 
-                assert "test-content" in request_data
-                assert "success" in request_data
-                assert "s3://bucket/file.jpg" in request_data
-                assert "test-model" in request_data
+            # Check that the request was made with correct payload
+            requests = mock_responses.requests
+            assert len(requests) == 1
+
+            # Get the first request made to any URL
+            first_request_list = list(requests.values())[0]
+            assert len(first_request_list) == 1
+            request_data = first_request_list[0].kwargs.get("data")
+            assert isinstance(request_data, aiohttp.BytesPayload)
+            request_data = request_data.decode()
+
+            assert "test-content" in request_data
+            assert "success" in request_data
+            assert "s3://bucket/file.jpg" in request_data
+            assert "test-model" in request_data
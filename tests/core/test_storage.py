@@ -5,14 +5,69 @@ This module tests the LocalStorageUploader class and storage operations
 with mocked aiofiles operations.
 """
 
+import asyncio
+import errno
+import os
+import threading
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from ymago.core import storage
 from ymago.core.storage import LocalStorageUploader
 
 
+async def _exists_true(_path):
+    return True
+
+
+async def _exists_false(_path):
+    return False
+
+
+class _FakeAIOFile:
+    """In-memory stand-in for an aiofiles handle."""
+
+    def __init__(self, data: bytes = b""):
+        self._buf = memoryview(data)
+        self._pos = 0
+        self.written = bytearray()
+        self.write_count = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self, size: int = -1):
+        end = len(self._buf) if size < 0 else self._pos + size
+        chunk = self._buf[self._pos : end]
+        self._pos += len(chunk)
+        return chunk
+
+    async def readinto(self, buffer):
+        chunk = await self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    async def write(self, data):
+        self.written += data
+        self.write_count += 1
+        return len(data)
+
+
+def _fake_open(source: _FakeAIOFile, dest: _FakeAIOFile):
+    """Build an ``aiofiles.open`` replacement serving ``source`` for reads."""
+
+    def _open(path, mode="r", **kwargs):
+        return source if "r" in mode else dest
+
+    return _open
+
+
+@pytest.mark.xdist_group("storage")
 class TestLocalStorageUploader:
     """Test the LocalStorageUploader class."""
 
@@ -21,7 +76,7 @@ class TestLocalStorageUploader:
         base_dir = Path("/test/absolute/path")
         uploader = LocalStorageUploader(base_directory=base_dir, create_dirs=True)
 
-        assert uploader.base_directory == base_dir.resolve()
+        assert uploader.base_directory == Path(os.path.abspath(base_dir))
         assert uploader.create_dirs is True
 
     def test_init_with_relative_path(self):
@@ -32,8 +87,9 @@ class TestLocalStorageUploader:
         assert uploader.base_directory.is_absolute()
         assert uploader.create_dirs is False
 
-    @pytest.mark.asyncio
-    async def test_upload_success(self, temp_directory, sample_image_bytes):
+    async def test_upload_success(
+        self, temp_directory, sample_image_bytes, monkeypatch
+    ):
         """Test successful file upload."""
         base_dir = temp_directory / "output"
         uploader = LocalStorageUploader(base_directory=base_dir, create_dirs=True)
@@ -41,46 +97,27 @@ class TestLocalStorageUploader:
         source_file = temp_directory / "source.png"
         destination_key = "images/test_image.png"
 
-        with (
-            patch("ymago.core.storage.aiofiles.os.path.exists") as mock_exists,
-            patch("ymago.core.storage.aiofiles.os.makedirs") as mock_makedirs,
-            patch("ymago.core.storage.aiofiles.open", create=True) as mock_open,
-        ):
-            # Mock source file exists
-            mock_exists.return_value = True
-
-            # Mock file operations
-            mock_source_file = AsyncMock()
-            mock_dest_file = AsyncMock()
-
-            # IMPORTANT: First read returns data, second returns empty bytes (EOF)
-            mock_source_file.read.side_effect = [sample_image_bytes, b""]
-            mock_dest_file.write = AsyncMock()
-
-            def open_side_effect(path, mode="r", **kwargs):
-                mock_context = AsyncMock()
-                if "source" in str(path):
-                    mock_context.__aenter__.return_value = mock_source_file
-                else:
-                    mock_context.__aenter__.return_value = mock_dest_file
-                return mock_context
+        monkeypatch.setattr(storage.aiofiles.os.path, "exists", _exists_true)
 
-            mock_open.side_effect = open_side_effect
+        source = _FakeAIOFile(sample_image_bytes)
+        dest = _FakeAIOFile()
+        monkeypatch.setattr(storage, "_HAS_SENDFILE", False)
+        monkeypatch.setattr(storage.aiofiles, "open", _fake_open(source, dest))
 
+        with patch("ymago.core.storage.aiofiles.os.makedirs") as mock_makedirs:
             result = await uploader.upload(source_file, destination_key)
 
             expected_path = base_dir / destination_key
-            assert result == str(expected_path.resolve())
+            assert result == str(expected_path)
 
             # Verify directory creation was called
-            mock_makedirs.assert_called_once_with(expected_path.parent, exist_ok=True)
+            mock_makedirs.assert_called_once_with(
+                str(expected_path.parent), exist_ok=True
+            )
 
-            # Verify file operations
-            mock_source_file.read.assert_called()
-            mock_dest_file.write.assert_called_with(sample_image_bytes)
+        assert bytes(dest.written) == sample_image_bytes
 
-    @pytest.mark.asyncio
-    async def test_upload_source_file_not_found(self, temp_directory):
+    async def test_upload_source_file_not_found(self, temp_directory, monkeypatch):
         """Test upload raises FileNotFoundError when source doesn't exist."""
         base_dir = temp_directory / "output"
         uploader = LocalStorageUploader(base_directory=base_dir)
@@ -88,14 +125,14 @@ class TestLocalStorageUploader:
         source_file = temp_directory / "nonexistent.png"
         destination_key = "images/test_image.png"
 
-        with patch("ymago.core.storage.aiofiles.os.path.exists") as mock_exists:
-            mock_exists.return_value = False
+        monkeypatch.setattr(storage.aiofiles.os.path, "exists", _exists_false)
 
-            with pytest.raises(FileNotFoundError, match="Source file not found"):
-                await uploader.upload(source_file, destination_key)
+        with pytest.raises(FileNotFoundError, match="Source file not found"):
+            await uploader.upload(source_file, destination_key)
 
-    @pytest.mark.asyncio
-    async def test_upload_without_create_dirs(self, temp_directory, sample_image_bytes):
+    async def test_upload_without_create_dirs(
+        self, temp_directory, sample_image_bytes, monkeypatch
+    ):
         """Test upload without directory creation."""
         base_dir = temp_directory / "output"
         uploader = LocalStorageUploader(base_directory=base_dir, create_dirs=False)
@@ -103,104 +140,88 @@ class TestLocalStorageUploader:
         source_file = temp_directory / "source.png"
         destination_key = "test_image.png"
 
-        with (
-            patch("ymago.core.storage.aiofiles.os.path.exists") as mock_exists,
-            patch("ymago.core.storage.aiofiles.os.makedirs") as mock_makedirs,
-            patch("ymago.core.storage.aiofiles.open", create=True) as mock_open,
-        ):
-            mock_exists.return_value = True
-
-            # Mock file operations
-            mock_source_file = AsyncMock()
-            mock_dest_file = AsyncMock()
-
-            # IMPORTANT: First read returns data, second returns empty bytes (EOF)
-            mock_source_file.read.side_effect = [sample_image_bytes, b""]
+        monkeypatch.setattr(storage.aiofiles.os.path, "exists", _exists_true)
 
-            def open_side_effect(path, mode="r", **kwargs):
-                mock_context = AsyncMock()
-                if "source" in str(path):
-                    mock_context.__aenter__.return_value = mock_source_file
-                else:
-                    mock_context.__aenter__.return_value = mock_dest_file
-                return mock_context
-
-            mock_open.side_effect = open_side_effect
+        source = _FakeAIOFile(sample_image_bytes)
+        dest = _FakeAIOFile()
+        monkeypatch.setattr(storage, "_HAS_SENDFILE", False)
+        monkeypatch.setattr(storage.aiofiles, "open", _fake_open(source, dest))
 
+        with patch("ymago.core.storage.aiofiles.os.makedirs") as mock_makedirs:
             await uploader.upload(source_file, destination_key)
 
             # Directory creation should not be called
             mock_makedirs.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_exists_file_exists(self, temp_directory):
+    async def test_exists_file_exists(self, temp_directory, monkeypatch):
         """Test exists method returns True for existing file."""
         base_dir = temp_directory / "output"
         uploader = LocalStorageUploader(base_directory=base_dir)
 
         file_key = "images/test_image.png"
 
-        with patch("ymago.core.storage.aiofiles.os.path.exists") as mock_exists:
-            mock_exists.return_value = True
+        checked = []
+
+        async def _exists(path):
+            checked.append(path)
+            return True
 
-            result = await uploader.exists(file_key)
+        monkeypatch.setattr(storage.aiofiles.os.path, "exists", _exists)
 
-            assert result is True
-            expected_path = base_dir / file_key
-            mock_exists.assert_called_once_with(expected_path)
+        result = await uploader.exists(file_key)
 
-    @pytest.mark.asyncio
-    async def test_exists_file_not_exists(self, temp_directory):
+        assert result is True
+        expected_path = base_dir / file_key
+        assert checked == [str(expected_path)]
+
+    async def test_exists_file_not_exists(self, temp_directory, monkeypatch):
         """Test exists method returns False for non-existing file."""
         base_dir = temp_directory / "output"
         uploader = LocalStorageUploader(base_directory=base_dir)
 
         file_key = "images/nonexistent.png"
 
-        with patch("ymago.core.storage.aiofiles.os.path.exists") as mock_exists:
-            mock_exists.return_value = False
+        monkeypatch.setattr(storage.aiofiles.os.path, "exists", _exists_false)
 
-            result = await uploader.exists(file_key)
+        result = await uploader.exists(file_key)
 
-            assert result is False
+        assert result is False
 
-    @pytest.mark.asyncio
-    async def test_delete_existing_file(self, temp_directory):
+    async def test_delete_existing_file(self, temp_directory, monkeypatch):
         """Test delete method removes existing file."""
         base_dir = temp_directory / "output"
         uploader = LocalStorageUploader(base_directory=base_dir)
 
         file_key = "images/test_image.png"
 
-        with (
-            patch("ymago.core.storage.aiofiles.os.path.exists") as mock_exists,
-            patch("ymago.core.storage.aiofiles.os.remove") as mock_remove,
-        ):
-            mock_exists.return_value = True
+        removed = []
+
+        async def _remove(path):
+            removed.append(path)
+
+        monkeypatch.setattr(storage.aiofiles.os.path, "exists", _exists_true)
+        monkeypatch.setattr(storage.aiofiles.os, "remove", _remove)
 
-            result = await uploader.delete(file_key)
+        result = await uploader.delete(file_key)
 
-            assert result is True
-            expected_path = base_dir / file_key
-            mock_remove.assert_called_once_with(expected_path)
+        assert result is True
+        expected_path = base_dir / file_key
+        assert removed == [str(expected_path)]
 
-    @pytest.mark.asyncio
-    async def test_delete_nonexistent_file(self, temp_directory):
+    async def test_delete_nonexistent_file(self, temp_directory, monkeypatch):
         """Test delete method returns False for non-existing file."""
         base_dir = temp_directory / "output"
         uploader = LocalStorageUploader(base_directory=base_dir)
 
         file_key = "images/nonexistent.png"
 
-        with patch("ymago.core.storage.aiofiles.os.path.exists") as mock_exists:
-            mock_exists.return_value = False
+        monkeypatch.setattr(storage.aiofiles.os.path, "exists", _exists_false)
 
-            result = await uploader.delete(file_key)
+        result = await uploader.delete(file_key)
 
-            assert result is False
+        assert result is False
 
-    @pytest.mark.asyncio
-    async def test_upload_permission_error(self, temp_directory):
+    async def test_upload_permission_error(self, temp_directory, monkeypatch):
         """Test upload handles permission errors gracefully."""
         base_dir = temp_directory / "output"
         uploader = LocalStorageUploader(base_directory=base_dir, create_dirs=True)
@@ -208,18 +229,16 @@ class TestLocalStorageUploader:
         source_file = temp_directory / "source.png"
         destination_key = "images/test_image.png"
 
-        with (
-            patch("ymago.core.storage.aiofiles.os.path.exists") as mock_exists,
-            patch("ymago.core.storage.aiofiles.os.makedirs") as mock_makedirs,
-        ):
-            mock_exists.return_value = True
-            mock_makedirs.side_effect = PermissionError("Permission denied")
+        async def _makedirs(path, exist_ok=False):
+            raise PermissionError("Permission denied")
 
-            with pytest.raises(PermissionError):
-                await uploader.upload(source_file, destination_key)
+        monkeypatch.setattr(storage.aiofiles.os.path, "exists", _exists_true)
+        monkeypatch.setattr(storage.aiofiles.os, "makedirs", _makedirs)
+
+        with pytest.raises(PermissionError):
+            await uploader.upload(source_file, destination_key)
 
-    @pytest.mark.asyncio
-    async def test_upload_with_chunked_reading(self, temp_directory):
+    async def test_upload_with_chunked_reading(self, temp_directory, monkeypatch):
         """Test upload handles large files with chunked reading."""
         base_dir = temp_directory / "output"
         uploader = LocalStorageUploader(base_directory=base_dir, create_dirs=True)
@@ -227,42 +246,217 @@ class TestLocalStorageUploader:
         source_file = temp_directory / "large_source.png"
         destination_key = "images/large_image.png"
 
-        # Use small test chunks to avoid memory issues
-        chunk1 = b"test_chunk_1"
-        chunk2 = b"test_chunk_2"
-        chunk3 = b""  # End of file - this is critical for stopping the while loop
+        # One full 64KB chunk plus a short tail forces two reads before EOF
+        data = b"x" * (64 * 1024) + b"tail"
+        source = _FakeAIOFile(data)
+        dest = _FakeAIOFile()
 
-        with (
-            patch("ymago.core.storage.aiofiles.os.path.exists") as mock_exists,
-            patch("ymago.core.storage.aiofiles.os.makedirs"),
-            patch("ymago.core.storage.aiofiles.open", create=True) as mock_open,
-        ):
-            mock_exists.return_value = True
+        monkeypatch.setattr(storage.aiofiles.os.path, "exists", _exists_true)
+        monkeypatch.setattr(storage, "_HAS_SENDFILE", False)
+        monkeypatch.setattr(storage.aiofiles, "open", _fake_open(source, dest))
 
-            # Mock file operations with chunked reading
-            mock_source_file = AsyncMock()
-            mock_dest_file = AsyncMock()
+        with patch("ymago.core.storage.aiofiles.os.makedirs"):
+            result = await uploader.upload(source_file, destination_key)
 
-            # IMPORTANT: The empty bytes b"" signals EOF and stops the while loop
-            mock_source_file.read.side_effect = [chunk1, chunk2, chunk3]
-            mock_dest_file.write = AsyncMock()
+        expected_path = base_dir / destination_key
+        assert result == str(expected_path)
 
-            def open_side_effect(path, mode="r", **kwargs):
-                mock_context = AsyncMock()
-                if "large_source" in str(path):
-                    mock_context.__aenter__.return_value = mock_source_file
-                else:
-                    mock_context.__aenter__.return_value = mock_dest_file
-                return mock_context
+        # Verify chunked writing (only non-empty chunks are written)
+        assert dest.write_count == 2
+        assert bytes(dest.written) == data
 
-            mock_open.side_effect = open_side_effect
+    @pytest.mark.skipif(not storage._HAS_SENDFILE, reason="requires Linux sendfile")
+    async def test_upload_uses_single_sendfile_for_small_file(
+        self, temp_directory, sample_image_bytes, monkeypatch
+    ):
+        """Test the kernel copy path issues one sendfile call per small file."""
+        base_dir = temp_directory / "output"
+        uploader = LocalStorageUploader(
+            base_directory=base_dir, create_dirs=True, hardlink_on_same_fs=False
+        )
 
-            result = await uploader.upload(source_file, destination_key)
+        source_file = temp_directory / "source.png"
+        source_file.write_bytes(sample_image_bytes)
 
-            expected_path = base_dir / destination_key
-            assert result == str(expected_path.resolve())
+        real_sendfile = storage.os.sendfile
+        calls = []
+
+        monkeypatch.setattr(storage, "_use_copy_file_range", False)
+
+        def _counting_sendfile(out_fd, in_fd, offset, count):
+            calls.append(count)
+            return real_sendfile(out_fd, in_fd, offset, count)
+
+        monkeypatch.setattr(storage.os, "sendfile", _counting_sendfile)
+
+        result = await uploader.upload(source_file, "images/copy.png")
+
+        assert Path(result).read_bytes() == sample_image_bytes
+        assert calls == [len(sample_image_bytes)]
+
+    @pytest.mark.skipif(not storage._HAS_SENDFILE, reason="requires Linux sendfile")
+    async def test_concurrent_uploads_share_copy_pool(
+        self, temp_directory, monkeypatch
+    ):
+        """Test many concurrent uploads are served by the bounded copy pool."""
+        base_dir = temp_directory / "output"
+        uploader = LocalStorageUploader(
+            base_directory=base_dir, create_dirs=True, hardlink_on_same_fs=False
+        )
+
+        sources = []
+        for i in range(100):
+            source_file = temp_directory / f"source_{i}.bin"
+            source_file.write_bytes(f"payload-{i}".encode())
+            sources.append(source_file)
+
+        real_sendfile = storage.os.sendfile
+        threads = set()
+
+        monkeypatch.setattr(storage, "_use_copy_file_range", False)
+
+        def _recording_sendfile(out_fd, in_fd, offset, count):
+            threads.add(threading.current_thread().name)
+            return real_sendfile(out_fd, in_fd, offset, count)
+
+        monkeypatch.setattr(storage.os, "sendfile", _recording_sendfile)
+
+        results = await asyncio.gather(
+            *(
+                uploader.upload(source_file, f"copies/{source_file.name}")
+                for source_file in sources
+            )
+        )
+
+        for i, result in enumerate(results):
+            assert Path(result).read_bytes() == f"payload-{i}".encode()
+        assert len(threads) <= storage._COPY_POOL_SIZE
+        assert all(name.startswith("ymago-copy") for name in threads)
+
+    @pytest.mark.skipif(not storage._HAS_SENDFILE, reason="requires Linux sendfile")
+    @pytest.mark.parametrize(
+        ("error", "still_enabled"),
+        [(errno.EXDEV, True), (errno.EINVAL, True), (errno.ENOSYS, False)],
+        ids=["exdev", "einval", "enosys"],
+    )
+    async def test_upload_falls_back_when_copy_file_range_fails(
+        self, temp_directory, sample_image_bytes, monkeypatch, error, still_enabled
+    ):
+        """Test copy_file_range failures fall back to sendfile.
+
+        Only a missing syscall disables copy_file_range for the process; a
+        rejected source/destination pair falls back for that copy alone.
+        """
+        base_dir = temp_directory / "output"
+        uploader = LocalStorageUploader(
+            base_directory=base_dir, create_dirs=True, hardlink_on_same_fs=False
+        )
+
+        source_file = temp_directory / "source.png"
+        source_file.write_bytes(sample_image_bytes)
+
+        def _failing(*args):
+            raise OSError(error, os.strerror(error))
+
+        monkeypatch.setattr(storage, "_use_copy_file_range", True)
+        monkeypatch.setattr(storage.os, "copy_file_range", _failing, raising=False)
+
+        result = await uploader.upload(source_file, "images/copy.png")
+
+        assert Path(result).read_bytes() == sample_image_bytes
+        assert storage._use_copy_file_range is still_enabled
+
+    async def test_chunked_uploads_reuse_pooled_buffer(
+        self, temp_directory, sample_image_bytes, monkeypatch
+    ):
+        """Test sequential chunked uploads borrow the same read buffer."""
+        base_dir = temp_directory / "output"
+        uploader = LocalStorageUploader(base_directory=base_dir, create_dirs=False)
+
+        monkeypatch.setattr(storage, "_HAS_SENDFILE", False)
+        monkeypatch.setattr(storage.aiofiles.os.path, "exists", _exists_true)
+
+        buffers = []
+        for name in ("first.png", "second.png"):
+            source = _FakeAIOFile(sample_image_bytes)
+            dest = _FakeAIOFile()
+            monkeypatch.setattr(storage.aiofiles, "open", _fake_open(source, dest))
+
+            await uploader.upload(temp_directory / "source.png", name)
+
+            assert bytes(dest.written) == sample_image_bytes
+            assert len(uploader._free_buffers) == 1
+            buffers.append(uploader._free_buffers[0])
+
+        assert buffers[0] is buffers[1]
+
+    async def test_upload_hardlink_same_fs(
+        self, temp_directory, sample_image_bytes, monkeypatch
+    ):
+        """Test uploads on the same filesystem are hard-linked, not copied."""
+        base_dir = temp_directory / "output"
+        uploader = LocalStorageUploader(
+            base_directory=base_dir, create_dirs=True, hardlink_on_same_fs=True
+        )
+
+        source_file = temp_directory / "source.png"
+        source_file.write_bytes(sample_image_bytes)
+
+        def _no_open(*args, **kwargs):
+            raise AssertionError("hard-linked upload must not open files")
+
+        monkeypatch.setattr(storage.aiofiles, "open", _no_open)
+        monkeypatch.setattr(storage, "_HAS_SENDFILE", False)
+
+        result = await uploader.upload(source_file, "images/linked.png")
+
+        assert Path(result).read_bytes() == sample_image_bytes
+        assert os.path.samefile(result, source_file)
+
+    async def test_upload_copies_by_default(self, temp_directory):
+        """Test the default upload is independent of later edits to the source."""
+        uploader = LocalStorageUploader(base_directory=temp_directory / "output")
+
+        source_file = temp_directory / "source.png"
+        source_file.write_bytes(b"original")
+
+        result = await uploader.upload(source_file, "images/copy.png")
+        source_file.write_bytes(b"edited")
+
+        assert Path(result).read_bytes() == b"original"
+
+    @pytest.mark.parametrize("hardlink", [False, True], ids=["copy", "hardlink"])
+    async def test_upload_overwrite_keeps_previous_source(
+        self, temp_directory, hardlink
+    ):
+        """Test re-uploading to a linked destination never writes into its source."""
+        uploader = LocalStorageUploader(
+            base_directory=temp_directory / "output", hardlink_on_same_fs=hardlink
+        )
+
+        first = temp_directory / "a.png"
+        first.write_bytes(b"AAAA")
+        second = temp_directory / "b.png"
+        second.write_bytes(b"BBBBBBBB")
+
+        await uploader.upload(first, "images/img.png")
+        result = await uploader.upload(second, "images/img.png")
+
+        assert Path(result).read_bytes() == b"BBBBBBBB"
+        assert first.read_bytes() == b"AAAA"
+
+    async def test_upload_hardlink_from_symlink(self, temp_directory):
+        """Test a symlinked source is published as the file it points to."""
+        uploader = LocalStorageUploader(
+            base_directory=temp_directory / "output", hardlink_on_same_fs=True
+        )
+
+        target = temp_directory / "target.png"
+        target.write_bytes(b"target-bytes")
+        link = temp_directory / "link.png"
+        link.symlink_to("target.png")
+
+        result = await uploader.upload(link, "images/linked.png")
 
-            # Verify chunked writing (only non-empty chunks are written)
-            assert mock_dest_file.write.call_count == 2  # chunk1 and chunk2
-            mock_dest_file.write.assert_any_call(chunk1)
-            mock_dest_file.write.assert_any_call(chunk2)
+        assert not os.path.islink(result)
+        assert Path(result).read_bytes() == b"target-bytes"
@@ -0,0 +1,46 @@
+"""
+Response builders shared by the ymago test suite.
+
+The Gemini SDK responses are stood in for by ``SimpleNamespace`` trees that
+carry only the attributes ``ymago.api`` reads.
+"""
+
+from types import SimpleNamespace
+
+
+def make_image_response(data, finish_reason="STOP"):
+    """Build a generate_content response carrying a single inline image part."""
+    part = SimpleNamespace(inline_data=SimpleNamespace(data=data))
+    return SimpleNamespace(
+        candidates=[
+            SimpleNamespace(
+                finish_reason=finish_reason, content=SimpleNamespace(parts=[part])
+            )
+        ]
+    )
+
+
+def make_empty_response():
+    """Build a generate_content response with no candidates."""
+    return SimpleNamespace(candidates=[])
+
+
+def make_safety_response():
+    """Build a generate_content response blocked by the safety filters."""
+    return SimpleNamespace(candidates=[SimpleNamespace(finish_reason="SAFETY")])
+
+
+def make_no_content_response():
+    """Build a generate_content response whose candidate has no content."""
+    return SimpleNamespace(
+        candidates=[SimpleNamespace(finish_reason="STOP", content=None)]
+    )
+
+
+def make_no_parts_response():
+    """Build a generate_content response whose content has no parts."""
+    return SimpleNamespace(
+        candidates=[
+            SimpleNamespace(finish_reason="STOP", content=SimpleNamespace(parts=[]))
+        ]
+    )
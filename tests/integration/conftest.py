@@ -0,0 +1,50 @@
+"""
+Shared fixtures for integration tests.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# RAM-backed filesystem available on most Linux hosts and CI runners
+_SHM_DIR = Path("/dev/shm")
+
+
+@pytest.fixture(autouse=True)
+def plain_cli_output(monkeypatch):
+    """Render batch summaries as plain lines instead of Rich tables."""
+    monkeypatch.setenv("YMAGO_PLAIN_OUTPUT", "1")
+
+
+@pytest.fixture(scope="session")
+def memory_tmp_root():
+    """
+    Provide one tmpfs directory for the whole session, or None if unavailable.
+
+    It is removed once at the end of the session rather than per test.
+    """
+    if not (_SHM_DIR.is_dir() and os.access(_SHM_DIR, os.W_OK)):
+        yield None
+        return
+
+    root = Path(tempfile.mkdtemp(prefix="ymago-test-", dir=_SHM_DIR))
+    try:
+        yield root
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def memory_tmp_path(request, memory_tmp_root):
+    """
+    Provide a per-test directory on tmpfs, falling back to tmp_path.
+
+    Tests that only need throwaway files avoid disk I/O when /dev/shm is
+    writable; elsewhere this behaves like the built-in tmp_path.
+    """
+    if memory_tmp_root is None:
+        return request.getfixturevalue("tmp_path")
+    return Path(tempfile.mkdtemp(dir=memory_tmp_root))
@@ -6,40 +6,88 @@ interface, including argument validation and end-to-end processing.
 """
 
 import json
-import tempfile
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
 
-from ymago.cli import app
+from ymago import cli as cli_module
+from ymago.cli import app, run_batch_command
 from ymago.models import BatchSummary
 
 
+def _make_backend(summary=None, exc=None):
+    """Build a backend stub whose process_batch records kwargs and returns/raises."""
+    backend = SimpleNamespace(call_count=0, last_kwargs=None)
+
+    async def _process_batch(**kwargs):
+        backend.call_count += 1
+        backend.last_kwargs = kwargs
+        if exc is not None:
+            raise exc
+        return summary
+
+    backend.process_batch = _process_batch
+    return backend
+
+
 class TestBatchCLI:
     """Test batch CLI command functionality."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
+    # Summaries returned by the mocked backend; never mutated by the CLI
+    SUMMARY_OK = BatchSummary(
+        total_requests=3,
+        successful=2,
+        failed=1,
+        skipped=0,
+        processing_time_seconds=10.5,
+        results_log_path="results/state.jsonl",
+        throughput_requests_per_minute=17.1,
+        start_time="2024-01-01T00:00:00Z",
+        end_time="2024-01-01T00:00:10Z",
+    )
+    SUMMARY_RESUMED = BatchSummary(
+        total_requests=3,
+        successful=1,
+        failed=0,
+        skipped=2,  # 2 were already completed
+        processing_time_seconds=5.0,
+        results_log_path="results/state.jsonl",
+        throughput_requests_per_minute=12.0,
+        start_time="2024-01-01T00:00:00Z",
+        end_time="2024-01-01T00:00:05Z",
+    )
+
+    @pytest.fixture(scope="module")
+    def mock_config(self):
+        """Provide a single mock configuration shared by the module."""
+        return MagicMock()
 
     @pytest.fixture
-    def sample_csv_file(self):
-        """Create a sample CSV file for testing."""
+    def patched_cli(self, monkeypatch, mock_config):
+        """Make ymago.cli.load_config return the shared mock configuration."""
+
+        async def _load_config(*args, **kwargs):
+            return mock_config
+
+        monkeypatch.setattr(cli_module, "load_config", _load_config)
+        return mock_config
+
+    @pytest.fixture(scope="session")
+    def sample_csv_file(self, tmp_path_factory):
+        """Write a sample CSV file once for the whole test session."""
         csv_content = """prompt,output_name,seed
 "A beautiful sunset","sunset",42
 "A mountain landscape","mountain",123
 "A forest scene","forest",456
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write(csv_content)
-            return Path(f.name)
+        path = tmp_path_factory.mktemp("batch") / "sample.csv"
+        path.write_text(csv_content)
+        return path
 
-    @pytest.fixture
-    def sample_jsonl_file(self):
-        """Create a sample JSONL file for testing."""
+    @pytest.fixture(scope="session")
+    def sample_jsonl_file(self, tmp_path_factory):
+        """Write a sample JSONL file once for the whole test session."""
         jsonl_lines = [
             {"prompt": "A beautiful sunset", "output_filename": "sunset", "seed": 42},
             {
@@ -50,9 +98,9 @@ class TestBatchCLI:
             {"prompt": "A forest scene", "output_filename": "forest", "seed": 456},
         ]
         jsonl_content = "\n".join(json.dumps(line) for line in jsonl_lines)
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            f.write(jsonl_content)
-            return Path(f.name)
+        path = tmp_path_factory.mktemp("batch") / "sample.jsonl"
+        path.write_text(jsonl_content)
+        return path
 
     def test_batch_run_help(self, runner):
         """Test batch run command help."""
@@ -82,326 +130,204 @@ class TestBatchCLI:
 
     def test_batch_run_nonexistent_file(self, runner):
         """Test batch run command with non-existent input file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = runner.invoke(
-                app, ["batch", "run", "/nonexistent/file.csv", "--output-dir", temp_dir]
-            )
-            assert result.exit_code == 1
-            assert "Input file not found" in result.stdout
+        # The input check fails before the output directory is touched
+        result = runner.invoke(
+            app,
+            [
+                "batch",
+                "run",
+                "/nonexistent/file.csv",
+                "--output-dir",
+                "/nonexistent/out",
+            ],
+        )
+        assert result.exit_code == 1
+        assert "Input file not found" in result.stdout
 
     def test_batch_run_invalid_output_dir(self, runner, sample_csv_file):
         """Test batch run command with invalid output directory."""
-        try:
-            result = runner.invoke(
-                app,
+        result = runner.invoke(
+            app,
+            [
+                "batch",
+                "run",
+                str(sample_csv_file),
+                "--output-dir",
+                "/invalid/readonly/path",
+            ],
+        )
+        assert result.exit_code == 1
+        assert "Cannot write to output directory" in result.stdout
+
+    @pytest.mark.parametrize(
+        "fmt,extra_args,needles",
+        [
+            pytest.param(
+                "csv",
+                ["--dry-run"],
                 [
-                    "batch",
-                    "run",
-                    str(sample_csv_file),
-                    "--output-dir",
-                    "/invalid/readonly/path",
+                    "Dry run completed successfully",
+                    "Found 3 valid requests",
+                    "Would process 3 requests",
                 ],
-            )
-            assert result.exit_code == 1
-            assert "Cannot write to output directory" in result.stdout
-        finally:
-            sample_csv_file.unlink()
-
-    def test_batch_run_dry_run_csv(self, runner, sample_csv_file):
-        """Test batch run command with dry run on CSV file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                with patch("ymago.cli.load_config") as mock_config:
-                    mock_config.return_value = MagicMock()
-
-                    result = runner.invoke(
-                        app,
-                        [
-                            "batch",
-                            "run",
-                            str(sample_csv_file),
-                            "--output-dir",
-                            temp_dir,
-                            "--dry-run",
-                        ],
-                    )
-
-                    assert result.exit_code == 0
-                    assert "Dry run completed successfully" in result.stdout
-                    assert "Found 3 valid requests" in result.stdout
-                    assert "Would process 3 requests" in result.stdout
-            finally:
-                sample_csv_file.unlink()
-
-    def test_batch_run_dry_run_jsonl(self, runner, sample_jsonl_file):
-        """Test batch run command with dry run on JSONL file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                with patch("ymago.cli.load_config") as mock_config:
-                    mock_config.return_value = MagicMock()
-
-                    result = runner.invoke(
-                        app,
-                        [
-                            "batch",
-                            "run",
-                            str(sample_jsonl_file),
-                            "--output-dir",
-                            temp_dir,
-                            "--format",
-                            "jsonl",
-                            "--dry-run",
-                        ],
-                    )
-
-                    assert result.exit_code == 0
-                    assert "Dry run completed successfully" in result.stdout
-                    assert "Found 3 valid requests" in result.stdout
-            finally:
-                sample_jsonl_file.unlink()
-
-    def test_batch_run_parameter_validation(self, runner, sample_csv_file):
-        """Test batch run command parameter validation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                # Test invalid concurrency (too high)
-                result = runner.invoke(
-                    app,
-                    [
-                        "batch",
-                        "run",
-                        str(sample_csv_file),
-                        "--output-dir",
-                        temp_dir,
-                        "--concurrency",
-                        "100",  # Max is 50
-                        "--dry-run",
-                    ],
-                )
-                assert result.exit_code != 0
-
-                # Test invalid concurrency (too low)
-                result = runner.invoke(
-                    app,
-                    [
-                        "batch",
-                        "run",
-                        str(sample_csv_file),
-                        "--output-dir",
-                        temp_dir,
-                        "--concurrency",
-                        "0",  # Min is 1
-                        "--dry-run",
-                    ],
-                )
-                assert result.exit_code != 0
-
-            finally:
-                sample_csv_file.unlink()
-
-    def test_batch_run_full_execution_mock(self, runner, sample_csv_file):
+                id="csv",
+            ),
+            pytest.param(
+                "jsonl",
+                ["--format", "jsonl", "--dry-run"],
+                ["Dry run completed successfully", "Found 3 valid requests"],
+                id="jsonl",
+            ),
+            pytest.param(
+                "csv",
+                ["--format", "csv", "--dry-run"],
+                ["Found 3 valid requests"],
+                id="format-hint",
+            ),
+            pytest.param(
+                "csv",
+                ["--verbose", "--dry-run"],
+                [
+                    "Configuration loaded",
+                    "Input file:",
+                    "Output directory:",
+                    "Concurrency:",
+                    "Rate limit:",
+                ],
+                id="verbose",
+            ),
+        ],
+    )
+    def test_batch_run_dry_run(
+        self, runner, patched_cli, request, fmt, extra_args, needles, tmp_path
+    ):
+        """Test batch run dry runs across input formats and output options."""
+        input_file = request.getfixturevalue(f"sample_{fmt}_file")
+
+        result = runner.invoke(
+            app,
+            ["batch", "run", str(input_file), "--output-dir", str(tmp_path)]
+            + extra_args,
+        )
+
+        assert result.exit_code == 0
+        for needle in needles:
+            assert needle in result.stdout
+
+    @pytest.mark.parametrize("value", ["100", "0", "-1", "51"])
+    def test_batch_run_parameter_validation(self, runner, sample_csv_file, value):
+        """Test batch run rejects concurrency outside the 1-50 range."""
+        # Typer rejects the option during parsing, before any directory is used
+        result = runner.invoke(
+            app,
+            [
+                "batch",
+                "run",
+                str(sample_csv_file),
+                "--output-dir",
+                "/nonexistent/out",
+                "--concurrency",
+                value,
+                "--dry-run",
+            ],
+        )
+        # Click reports out-of-range options as a usage error
+        assert result.exit_code == 2
+
+    def test_batch_run_full_execution_mock(
+        self, patched_cli, sample_csv_file, capsys, tmp_path
+    ):
         """Test full batch execution with mocked backend."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                # Mock the configuration and backend
-                mock_summary = BatchSummary(
-                    total_requests=3,
-                    successful=2,
-                    failed=1,
-                    skipped=0,
-                    processing_time_seconds=10.5,
-                    results_log_path=f"{temp_dir}/state.jsonl",
-                    throughput_requests_per_minute=17.1,
-                    start_time="2024-01-01T00:00:00Z",
-                    end_time="2024-01-01T00:00:10Z",
-                )
-
-                with patch("ymago.cli.load_config") as mock_config:
-                    with patch("ymago.cli.LocalExecutionBackend") as mock_backend_class:
-                        mock_config.return_value = MagicMock()
-                        mock_backend = MagicMock()
-                        mock_backend.process_batch = AsyncMock(
-                            return_value=mock_summary
-                        )
-                        mock_backend_class.return_value = mock_backend
-
-                        result = runner.invoke(
-                            app,
-                            [
-                                "batch",
-                                "run",
-                                str(sample_csv_file),
-                                "--output-dir",
-                                temp_dir,
-                                "--concurrency",
-                                "5",
-                                "--rate-limit",
-                                "120",
-                            ],
-                        )
-
-                        assert result.exit_code == 0
-                        assert "Batch Processing Complete" in result.stdout
-                        assert "Total Requests" in result.stdout
-                        assert "Successful" in result.stdout
-                        assert "Failed" in result.stdout
-
-                        # Verify backend was called with correct parameters
-                        mock_backend.process_batch.assert_called_once()
-                        call_args = mock_backend.process_batch.call_args
-                        assert call_args.kwargs["concurrency"] == 5
-                        assert call_args.kwargs["rate_limit"] == 120
-                        assert not call_args.kwargs["resume"]
-            finally:
-                sample_csv_file.unlink()
-
-    def test_batch_run_with_resume(self, runner, sample_csv_file):
+        with patch.object(cli_module, "LocalExecutionBackend") as mock_backend_class:
+            mock_backend = _make_backend(summary=self.SUMMARY_OK)
+            mock_backend_class.return_value = mock_backend
+
+            run_batch_command(
+                input_file=sample_csv_file,
+                output_dir=tmp_path,
+                concurrency=5,
+                rate_limit=120,
+            )
+
+            stdout = capsys.readouterr().out
+            assert "Batch Processing Complete" in stdout
+            assert "Total Requests" in stdout
+            assert "Successful" in stdout
+            assert "Failed" in stdout
+
+            # Verify backend was called with correct parameters
+            assert mock_backend.call_count == 1
+            assert mock_backend.last_kwargs["concurrency"] == 5
+            assert mock_backend.last_kwargs["rate_limit"] == 120
+            assert not mock_backend.last_kwargs["resume"]
+
+    @pytest.mark.parametrize("plain_output", [None, "0", "false"])
+    def test_batch_run_summary_table(
+        self, patched_cli, sample_csv_file, capsys, tmp_path, monkeypatch, plain_output
+    ):
+        """Test the summary is a Rich table unless plain output is switched on."""
+        if plain_output is None:
+            monkeypatch.delenv("YMAGO_PLAIN_OUTPUT", raising=False)
+        else:
+            monkeypatch.setenv("YMAGO_PLAIN_OUTPUT", plain_output)
+
+        with patch.object(cli_module, "LocalExecutionBackend") as mock_backend_class:
+            mock_backend_class.return_value = _make_backend(summary=self.SUMMARY_OK)
+
+            run_batch_command(input_file=sample_csv_file, output_dir=tmp_path)
+
+        stdout = capsys.readouterr().out
+        assert "Batch Processing Summary" in stdout
+        assert "Metric" in stdout
+        assert "Value" in stdout
+        assert "Success Rate" in stdout
+        # Table rows are drawn with box characters, not "Metric: value" lines
+        assert "│" in stdout
+        assert "Total Requests: 3" not in stdout
+
+    def test_batch_run_with_resume(
+        self, patched_cli, sample_csv_file, capsys, tmp_path
+    ):
         """Test batch run command with resume option."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                mock_summary = BatchSummary(
-                    total_requests=3,
-                    successful=1,
-                    failed=0,
-                    skipped=2,  # 2 were already completed
-                    processing_time_seconds=5.0,
-                    results_log_path=f"{temp_dir}/state.jsonl",
-                    throughput_requests_per_minute=12.0,
-                    start_time="2024-01-01T00:00:00Z",
-                    end_time="2024-01-01T00:00:05Z",
-                )
-
-                with patch("ymago.cli.load_config") as mock_config:
-                    with patch("ymago.cli.LocalExecutionBackend") as mock_backend_class:
-                        mock_config.return_value = MagicMock()
-                        mock_backend = MagicMock()
-                        mock_backend.process_batch = AsyncMock(
-                            return_value=mock_summary
-                        )
-                        mock_backend_class.return_value = mock_backend
-
-                        result = runner.invoke(
-                            app,
-                            [
-                                "batch",
-                                "run",
-                                str(sample_csv_file),
-                                "--output-dir",
-                                temp_dir,
-                                "--resume",
-                            ],
-                        )
-
-                        assert result.exit_code == 0
-                        assert "Skipped" in result.stdout
-
-                        # Verify resume was passed correctly
-                        call_args = mock_backend.process_batch.call_args
-                        assert call_args.kwargs["resume"]
-            finally:
-                sample_csv_file.unlink()
-
-    def test_batch_run_verbose_output(self, runner, sample_csv_file):
-        """Test batch run command with verbose output."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                with patch("ymago.cli.load_config") as mock_config:
-                    mock_config.return_value = MagicMock()
-
-                    result = runner.invoke(
-                        app,
-                        [
-                            "batch",
-                            "run",
-                            str(sample_csv_file),
-                            "--output-dir",
-                            temp_dir,
-                            "--verbose",
-                            "--dry-run",
-                        ],
-                    )
-
-                    assert result.exit_code == 0
-                    assert "Configuration loaded" in result.stdout
-                    assert "Input file:" in result.stdout
-                    assert "Output directory:" in result.stdout
-                    assert "Concurrency:" in result.stdout
-                    assert "Rate limit:" in result.stdout
-            finally:
-                sample_csv_file.unlink()
-
-    def test_batch_run_empty_file(self, runner):
-        """Test batch run command with empty input file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write("prompt,output_name\n")  # Header only, no data
-            empty_file = Path(f.name)
+        with patch.object(cli_module, "LocalExecutionBackend") as mock_backend_class:
+            mock_backend = _make_backend(summary=self.SUMMARY_RESUMED)
+            mock_backend_class.return_value = mock_backend
+
+            run_batch_command(
+                input_file=sample_csv_file,
+                output_dir=tmp_path,
+                resume=True,
+            )
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                with patch("ymago.cli.load_config") as mock_config:
-                    mock_config.return_value = MagicMock()
+            assert "Skipped" in capsys.readouterr().out
 
-                    result = runner.invoke(
-                        app, ["batch", "run", str(empty_file), "--output-dir", temp_dir]
-                    )
+            # Verify resume was passed correctly
+            assert mock_backend.last_kwargs["resume"]
 
-                    assert result.exit_code == 0
-                    assert "No valid requests found" in result.stdout
-            finally:
-                empty_file.unlink()
+    def test_batch_run_empty_file(self, runner, patched_cli, memory_tmp_path):
+        """Test batch run command with empty input file."""
+        empty_file = memory_tmp_path / "empty.csv"
+        empty_file.write_text("prompt,output_name\n")  # Header only, no data
+        output_dir = memory_tmp_path / "out"
+
+        result = runner.invoke(
+            app, ["batch", "run", str(empty_file), "--output-dir", str(output_dir)]
+        )
 
-    def test_batch_run_keyboard_interrupt(self, runner, sample_csv_file):
+        assert result.exit_code == 0
+        assert "No valid requests found" in result.stdout
+
+    def test_batch_run_keyboard_interrupt(
+        self, patched_cli, sample_csv_file, capsys, tmp_path
+    ):
         """Test batch run command handling of keyboard interrupt."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                with patch("ymago.cli.load_config") as mock_config:
-                    with patch("ymago.cli.LocalExecutionBackend") as mock_backend_class:
-                        mock_config.return_value = MagicMock()
-                        mock_backend = MagicMock()
-                        mock_backend.process_batch = AsyncMock(
-                            side_effect=KeyboardInterrupt()
-                        )
-                        mock_backend_class.return_value = mock_backend
-
-                        result = runner.invoke(
-                            app,
-                            [
-                                "batch",
-                                "run",
-                                str(sample_csv_file),
-                                "--output-dir",
-                                temp_dir,
-                            ],
-                        )
-
-                        assert result.exit_code == 1
-                        assert "cancelled by user" in result.stdout
-                        assert "Use --resume to continue" in result.stdout
-            finally:
-                sample_csv_file.unlink()
-
-    def test_batch_run_with_format_hint(self, runner, sample_csv_file):
-        """Test batch run command with explicit format hint."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                with patch("ymago.cli.load_config") as mock_config:
-                    mock_config.return_value = MagicMock()
-
-                    result = runner.invoke(
-                        app,
-                        [
-                            "batch",
-                            "run",
-                            str(sample_csv_file),
-                            "--output-dir",
-                            temp_dir,
-                            "--format",
-                            "csv",
-                            "--dry-run",
-                        ],
-                    )
-
-                    assert result.exit_code == 0
-                    assert "Found 3 valid requests" in result.stdout
-            finally:
-                sample_csv_file.unlink()
+        with patch.object(cli_module, "LocalExecutionBackend") as mock_backend_class:
+            mock_backend_class.return_value = _make_backend(exc=KeyboardInterrupt())
+
+            with pytest.raises(SystemExit) as exc_info:
+                run_batch_command(input_file=sample_csv_file, output_dir=tmp_path)
+
+            assert exc_info.value.code == 1
+            stdout = capsys.readouterr().out
+            assert "cancelled by user" in stdout
+            assert "Use --resume to continue" in stdout
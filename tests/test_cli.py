@@ -6,28 +6,61 @@ and error handling using CliRunner.
 """
 
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
 
 import pytest
-from typer.testing import CliRunner
 
 from ymago import __version__
-from ymago.cli import app
+from ymago.cli import app, generate_video_command
 from ymago.core.generation import GenerationError, StorageError
 
+pytestmark = pytest.mark.usefixtures("cli_mocks")
+
+_IMAGE_GENERATE = ("image", "generate")
+_VIDEO_GENERATE = ("video", "generate")
+_IMAGE_ALL_OPTIONS = (
+    *_IMAGE_GENERATE,
+    "A test prompt",
+    "--filename",
+    "custom_name",
+    "--seed",
+    "42",
+    "--quality",
+    "high",
+    "--aspect-ratio",
+    "16:9",
+    "--model",
+    "custom-model",
+    "--verbose",
+)
+_IMAGE_TYPED_OPTIONS = (
+    *_IMAGE_GENERATE,
+    "test prompt",
+    "--seed",
+    "123",
+    "--filename",
+    "test_file",
+)
+
+
+@pytest.fixture(scope="session")
+def help_outputs(runner):
+    """Render each static screen (help and version) once for the whole session."""
+    return {
+        "root": runner.invoke(app, ["--help"]),
+        "image": runner.invoke(app, ["image", "--help"]),
+        "image generate": runner.invoke(app, (*_IMAGE_GENERATE, "--help")),
+        "video": runner.invoke(app, ["video", "--help"]),
+        "video generate": runner.invoke(app, (*_VIDEO_GENERATE, "--help")),
+        "version": runner.invoke(app, ["version"]),
+    }
+
 
 class TestCLIRunner:
     """Test CLI commands using Typer's CliRunner."""
 
-    runner: CliRunner = None  # type: ignore[assignment]
-
-    def setup_method(self):
-        """Set up test runner for each test."""
-        self.runner = CliRunner()
-
-    def test_cli_help_command(self):
+    def test_cli_help_command(self, help_outputs):
         """Test main CLI help output."""
-        result = self.runner.invoke(app, ["--help"])
+        result = help_outputs["root"]
 
         assert result.exit_code == 0
         assert "ymago" in result.stdout
@@ -36,285 +69,139 @@ class TestCLIRunner:
         assert "config" in result.stdout
         assert "version" in result.stdout
 
-    def test_version_command(self):
+    def test_version_command(self, help_outputs):
         """Test version command output."""
-        result = self.runner.invoke(app, ["version"])
+        result = help_outputs["version"]
 
         assert result.exit_code == 0
         assert __version__ in result.stdout
 
-    def test_image_help_command(self):
+    def test_image_help_command(self, help_outputs):
         """Test image subcommand help."""
-        result = self.runner.invoke(app, ["image", "--help"])
+        result = help_outputs["image"]
 
         assert result.exit_code == 0
         assert "generate" in result.stdout
 
-    def test_image_generate_help_command(self):
+    def test_image_generate_help_command(self, help_outputs):
         """Test image generate command help."""
-        result = self.runner.invoke(app, ["image", "generate", "--help"])
+        result = help_outputs["image generate"]
 
         assert result.exit_code == 0
-        assert "prompt" in result.stdout
-        assert "--filename" in result.stdout
-        assert "--seed" in result.stdout
-        assert "--quality" in result.stdout
-        assert "--aspect-ratio" in result.stdout
-        assert "--model" in result.stdout
-        assert "--verbose" in result.stdout
+        expected = {
+            "prompt",
+            "--filename",
+            "--seed",
+            "--quality",
+            "--aspect-ratio",
+            "--model",
+            "--verbose",
+        }
+        assert expected - set(result.stdout.split()) == set()
 
 
 class TestConfigCommand:
     """Test the config command."""
 
-    runner: CliRunner = None  # type: ignore[assignment]
-
-    def setup_method(self):
-        """Set up test runner for each test."""
-        self.runner = CliRunner()
-
-    def test_config_command_success(self, sample_config):
+    def test_config_command_success(self, runner):
         """Test config command with successful configuration loading."""
-        with patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config:
-            mock_load_config.return_value = sample_config
+        result = runner.invoke(app, ["config"])
 
-            result = self.runner.invoke(app, ["config"])
-
-            assert result.exit_code == 0
-            assert "Current Configuration" in result.stdout
-            assert "Image Model" in result.stdout
-            assert "Output Path" in result.stdout
-            assert "API Key" in result.stdout
-            assert "***2345" in result.stdout  # Masked API key
+        assert result.exit_code == 0
+        assert "Current Configuration" in result.stdout
+        assert "Image Model" in result.stdout
+        assert "Output Path" in result.stdout
+        assert "API Key" in result.stdout
+        assert "***2345" in result.stdout  # Masked API key
 
-    def test_config_command_with_show_path(self, sample_config):
+    def test_config_command_with_show_path(self, runner, monkeypatch):
         """Test config command with --show-path option."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch("pathlib.Path.exists", return_value=True),
-        ):
-            mock_load_config.return_value = sample_config
+        monkeypatch.setattr(
+            "ymago.cli._find_config_file", lambda: Path("/tmp/ymago.toml")
+        )
 
-            result = self.runner.invoke(app, ["config", "--show-path"])
+        result = runner.invoke(app, ["config", "--show-path"])
 
-            assert result.exit_code == 0
-            assert "Configuration file:" in result.stdout
+        assert result.exit_code == 0
+        assert "Configuration file:" in result.stdout
 
-    def test_config_command_environment_variables_only(self, sample_config):
+    def test_config_command_environment_variables_only(self, runner, monkeypatch):
         """Test config command when using environment variables."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch("pathlib.Path.exists") as mock_exists,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_exists.return_value = False  # No config files exist
+        # No config files exist
+        monkeypatch.setattr("ymago.cli._find_config_file", lambda: None)
 
-            result = self.runner.invoke(app, ["config", "--show-path"])
+        result = runner.invoke(app, ["config", "--show-path"])
 
-            assert result.exit_code == 0
-            assert "Configuration from environment variables" in result.stdout
+        assert result.exit_code == 0
+        assert "Configuration from environment variables" in result.stdout
 
-    def test_config_command_load_error(self):
+    def test_config_command_load_error(self, runner, cli_mocks):
         """Test config command with configuration loading error."""
-        with patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config:
-            mock_load_config.side_effect = FileNotFoundError("No config found")
+        cli_mocks.load_config.side_effect = FileNotFoundError("No config found")
 
-            result = self.runner.invoke(app, ["config"])
+        result = runner.invoke(app, ["config"])
 
-            assert result.exit_code == 1
-            assert "Error loading configuration" in result.stdout
+        assert result.exit_code == 1
+        assert "Error loading configuration" in result.stdout
 
 
 class TestImageGenerateCommand:
     """Test the image generate command."""
 
-    runner: CliRunner = None  # type: ignore[assignment]
+    def test_generate_command_success(
+        self, runner, cli_mocks, sample_generation_result
+    ):
+        """Test successful image generation command."""
+        cli_mocks.process_job.return_value = sample_generation_result
 
-    def setup_method(self):
-        """Set up test runner for each test."""
-        self.runner = CliRunner()
+        result = runner.invoke(app, ["image", "generate", "A beautiful sunset"])
 
-    def test_generate_command_success(self, sample_config, sample_generation_result):
-        """Test successful image generation command."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.return_value = sample_generation_result
-
-            result = self.runner.invoke(
-                app, ["image", "generate", "A beautiful sunset"]
-            )
-
-            assert result.exit_code == 0
-            assert "✓ Image generated successfully!" in result.stdout
-            assert str(sample_generation_result.local_path) in result.stdout
+        assert result.exit_code == 0
+        assert "✓ Image generated successfully!" in result.stdout
+        assert str(sample_generation_result.local_path) in result.stdout
 
     def test_generate_command_with_all_options(
-        self, sample_config, sample_generation_result
+        self, runner, cli_mocks, sample_generation_result
     ):
         """Test image generation with all command options."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.return_value = sample_generation_result
-
-            result = self.runner.invoke(
-                app,
-                [
-                    "image",
-                    "generate",
-                    "A test prompt",
-                    "--filename",
-                    "custom_name",
-                    "--seed",
-                    "42",
-                    "--quality",
-                    "high",
-                    "--aspect-ratio",
-                    "16:9",
-                    "--model",
-                    "custom-model",
-                    "--verbose",
-                ],
-            )
-
-            assert result.exit_code == 0
-            assert "✓ Image generated successfully!" in result.stdout
-
-            # Verify the job was created with correct parameters
-            mock_process_job.assert_called_once()
-            job_arg = mock_process_job.call_args[0][0]
-            assert job_arg.prompt == "A test prompt"
-            assert job_arg.output_filename == "custom_name"
-            assert job_arg.seed == 42
-            assert job_arg.quality == "high"
-            assert job_arg.aspect_ratio == "16:9"
-            assert job_arg.image_model == "custom-model"
+        cli_mocks.process_job.return_value = sample_generation_result
+
+        result = runner.invoke(app, _IMAGE_ALL_OPTIONS)
+
+        assert result.exit_code == 0
+        assert "✓ Image generated successfully!" in result.stdout
+
+        # Verify the job was created with correct parameters
+        cli_mocks.process_job.assert_called_once()
+        job_arg = cli_mocks.process_job.call_args[0][0]
+        assert job_arg.prompt == "A test prompt"
+        assert job_arg.output_filename == "custom_name"
+        assert job_arg.seed == 42
+        assert job_arg.quality == "high"
+        assert job_arg.aspect_ratio == "16:9"
+        assert job_arg.image_model == "custom-model"
 
     def test_generate_command_verbose_mode(
-        self, sample_config, sample_generation_result
+        self, runner, cli_mocks, sample_generation_result
     ):
         """Test image generation in verbose mode."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.return_value = sample_generation_result
-
-            result = self.runner.invoke(
-                app, ["image", "generate", "A test prompt", "--verbose"]
-            )
-
-            assert result.exit_code == 0
-            assert "Generation Job Details" in result.stdout
-            assert "Prompt" in result.stdout
-            assert "Model" in result.stdout
-            assert "Generation Results" in result.stdout
-
-    def test_generate_command_config_error(self):
-        """Test image generation with configuration error."""
-        with patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config:
-            mock_load_config.side_effect = FileNotFoundError("No config found")
-
-            result = self.runner.invoke(app, ["image", "generate", "A test prompt"])
-
-            assert result.exit_code == 1
-            assert "Error:" in result.stdout
-
-    def test_generate_command_generation_error(self, sample_config):
-        """Test image generation with generation error."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.side_effect = GenerationError("API quota exceeded")
-
-            result = self.runner.invoke(app, ["image", "generate", "A test prompt"])
-
-            assert result.exit_code == 1
-            assert "Error:" in result.stdout
-            assert "API quota exceeded" in result.stdout
-
-    def test_generate_command_storage_error(self, sample_config):
-        """Test image generation with storage error."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.side_effect = StorageError("Permission denied")
-
-            result = self.runner.invoke(app, ["image", "generate", "A test prompt"])
-
-            assert result.exit_code == 1
-            assert "Error:" in result.stdout
-            assert "Permission denied" in result.stdout
-
-    def test_generate_command_unexpected_error(self, sample_config):
-        """Test image generation with unexpected error."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.side_effect = Exception("Unexpected error")
-
-            result = self.runner.invoke(app, ["image", "generate", "A test prompt"])
-
-            assert result.exit_code == 1
-            assert "Error:" in result.stdout
-
-    def test_generate_command_unexpected_error_verbose(self, sample_config):
-        """Test image generation with unexpected error in verbose mode."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.side_effect = Exception("Unexpected error")
-
-            result = self.runner.invoke(
-                app, ["image", "generate", "A test prompt", "--verbose"]
-            )
-
-            assert result.exit_code == 1
-            assert "Error:" in result.stdout
-            # In verbose mode, should show more details
-            assert "Exception" in result.stdout or "Traceback" in result.stdout
+        cli_mocks.process_job.return_value = sample_generation_result
 
+        result = runner.invoke(app, ["image", "generate", "A test prompt", "--verbose"])
 
-class TestParameterValidation:
-    """Test CLI parameter validation and parsing."""
+        assert result.exit_code == 0
+        assert "Generation Job Details" in result.stdout
+        assert "Prompt" in result.stdout
+        assert "Model" in result.stdout
+        assert "Generation Results" in result.stdout
 
-    runner: CliRunner = None  # type: ignore[assignment]
 
-    def setup_method(self):
-        """Set up test runner for each test."""
-        self.runner = CliRunner()
+class TestParameterValidation:
+    """Test CLI parameter validation and parsing."""
 
-    def test_generate_command_missing_prompt(self):
+    def test_generate_command_missing_prompt(self, runner):
         """Test error when prompt is missing."""
-        result = self.runner.invoke(app, ["image", "generate"])
+        result = runner.invoke(app, ["image", "generate"])
 
         assert result.exit_code != 0
         # Typer/Click puts error messages in stderr, not stdout
@@ -324,408 +211,235 @@ class TestParameterValidation:
             or result.exit_code == 2
         )
 
-    def test_generate_command_invalid_seed(self, sample_config):
+    def test_generate_command_invalid_seed(self, runner):
         """Test parameter validation with invalid seed."""
-        with patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config:
-            mock_load_config.return_value = sample_config
-
-            result = self.runner.invoke(
-                app, ["image", "generate", "test", "--seed", "not_a_number"]
-            )
+        result = runner.invoke(
+            app, ["image", "generate", "test", "--seed", "not_a_number"]
+        )
 
-            assert result.exit_code != 0
+        assert result.exit_code != 0
 
     def test_generate_command_parameter_types(
-        self, sample_config, sample_generation_result
+        self, runner, cli_mocks, sample_generation_result
     ):
         """Test that parameters are correctly typed."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.return_value = sample_generation_result
-
-            result = self.runner.invoke(
-                app,
-                [
-                    "image",
-                    "generate",
-                    "test prompt",
-                    "--seed",
-                    "123",
-                    "--filename",
-                    "test_file",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-            # Verify parameter types in the job
-            job_arg = mock_process_job.call_args[0][0]
-            assert isinstance(job_arg.seed, int)
-            assert job_arg.seed == 123
-            assert isinstance(job_arg.output_filename, str)
-            assert job_arg.output_filename == "test_file"
-
-
-class TestVideoGenerateCommand:
-    """Test video generation command functionality."""
+        cli_mocks.process_job.return_value = sample_generation_result
 
-    runner: CliRunner = None  # type: ignore[assignment]
+        result = runner.invoke(app, _IMAGE_TYPED_OPTIONS)
 
-    def setup_method(self):
-        """Set up test runner for each test."""
-        self.runner = CliRunner()
+        assert result.exit_code == 0
 
-    @pytest.fixture
-    def sample_config(self):
-        """Create a sample configuration for testing."""
-        from ymago.config import Auth, Defaults, Settings
+        # Verify parameter types in the job
+        job_arg = cli_mocks.process_job.call_args[0][0]
+        assert isinstance(job_arg.seed, int)
+        assert job_arg.seed == 123
+        assert isinstance(job_arg.output_filename, str)
+        assert job_arg.output_filename == "test_file"
 
-        return Settings(
-            auth=Auth(google_api_key="test_key"),
-            defaults=Defaults(
-                output_path=Path("/tmp/test"),
-                image_model="test-image-model",
-                video_model="test-video-model",
-            ),
-        )
 
-    @pytest.fixture
-    def sample_video_result(self):
-        """Create a sample video generation result."""
-        from pathlib import Path
-
-        from ymago.models import GenerationJob, GenerationResult
+class TestVideoGenerateCommand:
+    """Test video generation command functionality."""
 
-        job = GenerationJob(
-            prompt="Test video prompt",
-            media_type="video",
-            output_filename="test_video",
-            video_model="test-video-model",
-        )
-        return GenerationResult(
-            local_path=Path("/tmp/test/test_video.mp4"),
-            job=job,
-            metadata={"duration": "5s", "resolution": "1920x1080"},
-            file_size_bytes=1024000,
-            generation_time_seconds=15.5,
-        )
+    @pytest.fixture(autouse=True)
+    def _use_video_config(self, cli_mocks, sample_video_config):
+        """Load the video-model configuration for every test in this class."""
+        cli_mocks.load_config.return_value = sample_video_config
 
-    def test_video_help_command(self):
+    def test_video_help_command(self, help_outputs):
         """Test video subcommand help."""
-        result = self.runner.invoke(app, ["video", "--help"])
+        result = help_outputs["video"]
 
         assert result.exit_code == 0
         assert "generate" in result.stdout
         assert "Video generation commands" in result.stdout
 
-    def test_video_generate_help_command(self):
+    def test_video_generate_help_command(self, help_outputs):
         """Test video generate command help."""
-        result = self.runner.invoke(app, ["video", "generate", "--help"])
+        result = help_outputs["video generate"]
 
         assert result.exit_code == 0
-        assert "prompt" in result.stdout
-        assert "--filename" in result.stdout
-        assert "--from-image" in result.stdout
+        expected = {"prompt", "--filename", "--from-image"}
+        assert expected - set(result.stdout.split()) == set()
         if "--duration" not in result.stdout:
             pytest.skip("The --duration parameter is not implemented yet.")
         assert "--duration" in result.stdout
 
-    def test_video_generate_basic_success(self, sample_config, sample_video_result):
+    def test_video_generate_basic_success(self, runner, cli_mocks, sample_video_result):
         """Test basic video generation command."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.return_value = sample_video_result
-
-            result = self.runner.invoke(
-                app, ["video", "generate", "A beautiful sunset timelapse"]
-            )
-
-            assert result.exit_code == 0
-            assert (
-                "Video generated successfully" in result.stdout
-                or "Generated video saved" in result.stdout
-            )
-            assert "test_video.mp4" in result.stdout
-
-            # Verify the job was created correctly
-            mock_process_job.assert_called_once()
-            job_arg = mock_process_job.call_args[0][0]
-            assert job_arg.prompt == "A beautiful sunset timelapse"
-            assert job_arg.media_type == "video"
-            assert job_arg.video_model == "test-video-model"
-
-    def test_video_generate_with_custom_filename(
-        self, sample_config, sample_video_result
-    ):
-        """Test video generation with custom filename."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.return_value = sample_video_result
-
-            result = self.runner.invoke(
-                app,
-                [
-                    "video",
-                    "generate",
-                    "Ocean waves",
-                    "--filename",
-                    "ocean_waves_video",
-                ],
-            )
-
-            assert result.exit_code == 0
-            mock_process_job.assert_called_once()
-            job_arg = mock_process_job.call_args[0][0]
-            assert job_arg.output_filename == "ocean_waves_video"
-
-    def test_video_generate_from_image(self, sample_config, sample_video_result):
-        """Test video generation from an image URL."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.return_value = sample_video_result
-
-            result = self.runner.invoke(
-                app,
-                [
-                    "video",
-                    "generate",
-                    "Animate this image with motion",
-                    "--from-image",
-                    "https://example.com/image.jpg",
-                ],
-            )
-
-            assert result.exit_code == 0
-            mock_process_job.assert_called_once()
-            job_arg = mock_process_job.call_args[0][0]
-            assert job_arg.from_image == "https://example.com/image.jpg"
-
-    def test_video_generate_with_model_override(
-        self, sample_config, sample_video_result
+        cli_mocks.process_job.return_value = sample_video_result
+
+        result = runner.invoke(
+            app, ["video", "generate", "A beautiful sunset timelapse"]
+        )
+
+        assert result.exit_code == 0
+        assert (
+            "Video generated successfully" in result.stdout
+            or "Generated video saved" in result.stdout
+        )
+        assert "test_video.mp4" in result.stdout
+
+        # Verify the job was created correctly
+        cli_mocks.process_job.assert_called_once()
+        job_arg = cli_mocks.process_job.call_args[0][0]
+        assert job_arg.prompt == "A beautiful sunset timelapse"
+        assert job_arg.media_type == "video"
+        assert job_arg.video_model == "test-video-model"
+
+    @pytest.mark.parametrize(
+        ("options", "expected"),
+        [
+            (
+                {"output_filename": "ocean_waves_video"},
+                {"output_filename": "ocean_waves_video"},
+            ),
+            (
+                {"from_image": "https://example.com/image.jpg"},
+                {"from_image": "https://example.com/image.jpg"},
+            ),
+            ({"model": "custom-video-model"}, {"video_model": "custom-video-model"}),
+            (
+                {"negative_prompt": "people, buildings, text"},
+                {"negative_prompt": "people, buildings, text"},
+            ),
+            ({"seed": 42}, {"seed": 42}),
+        ],
+        ids=["filename", "from_image", "model", "negative_prompt", "seed"],
+    )
+    def test_video_generate_options(
+        self, cli_mocks, sample_video_result, options, expected
     ):
-        """Test video generation with custom model."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.return_value = sample_video_result
-
-            result = self.runner.invoke(
-                app,
-                [
-                    "video",
-                    "generate",
-                    "Dancing animation",
-                    "--model",
-                    "custom-video-model",
-                ],
-            )
-
-            assert result.exit_code == 0
-            mock_process_job.assert_called_once()
-            job_arg = mock_process_job.call_args[0][0]
-            assert job_arg.video_model == "custom-video-model"
-
-    def test_video_generate_verbose_mode(self, sample_config, sample_video_result):
+        """Test that each video option is bound onto the generation job."""
+        cli_mocks.process_job.return_value = sample_video_result
+
+        generate_video_command(prompt="Test video", **options)
+
+        cli_mocks.process_job.assert_called_once()
+        job_arg = cli_mocks.process_job.call_args[0][0]
+        for field, value in expected.items():
+            assert getattr(job_arg, field) == value
+
+    def test_video_generate_verbose_mode(self, runner, cli_mocks, sample_video_result):
         """Test video generation in verbose mode."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.return_value = sample_video_result
-
-            result = self.runner.invoke(
-                app, ["video", "generate", "Test video", "--verbose"]
-            )
-
-            assert result.exit_code == 0
-            assert "Generation Job Details" in result.stdout
-            assert "Media Type" in result.stdout
-            assert "video" in result.stdout
-            assert "Generation Results" in result.stdout
-            assert (
-                "1,024,000" in result.stdout or "1024000" in result.stdout
-            )  # File size (formatted or raw)
-            assert (
-                "15.50" in result.stdout or "15.5" in result.stdout
-            )  # Generation time
-
-    def test_video_generate_with_negative_prompt(
-        self, sample_config, sample_video_result
+        cli_mocks.process_job.return_value = sample_video_result
+
+        result = runner.invoke(app, ["video", "generate", "Test video", "--verbose"])
+
+        assert result.exit_code == 0
+        assert "Generation Job Details" in result.stdout
+        assert "Media Type" in result.stdout
+        assert "video" in result.stdout
+        assert "Generation Results" in result.stdout
+        assert (
+            "1,024,000" in result.stdout or "1024000" in result.stdout
+        )  # File size (formatted or raw)
+        assert "15.50" in result.stdout or "15.5" in result.stdout  # Generation time
+
+    def test_video_generate_from_local_image(
+        self, cli_mocks, sample_video_result, fake_image_path
     ):
-        """Test video generation with negative prompt."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.return_value = sample_video_result
-
-            result = self.runner.invoke(
-                app,
-                [
-                    "video",
-                    "generate",
-                    "Nature documentary",
-                    "--negative-prompt",
-                    "people, buildings, text",
-                ],
-            )
-
-            assert result.exit_code == 0
-            mock_process_job.assert_called_once()
-            job_arg = mock_process_job.call_args[0][0]
-            assert job_arg.negative_prompt == "people, buildings, text"
-
-    def test_video_generate_from_local_image(self, sample_config, sample_video_result):
         """Test video generation from a local image file."""
-        import tempfile
-        from pathlib import Path
-
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp_file:
-            temp_file.write(b"fake_image_data")
-            image_path = temp_file.name
-
-        try:
-            with (
-                patch(
-                    "ymago.cli.load_config", new_callable=AsyncMock
-                ) as mock_load_config,
-                patch(
-                    "ymago.cli.process_generation_job", new_callable=AsyncMock
-                ) as mock_process_job,
-            ):
-                mock_load_config.return_value = sample_config
-                mock_process_job.return_value = sample_video_result
-
-                result = self.runner.invoke(
-                    app,
-                    [
-                        "video",
-                        "generate",
-                        "Animate this local image",
-                        "--from-image",
-                        image_path,
-                    ],
-                )
-
-                assert result.exit_code == 0
-                mock_process_job.assert_called_once()
-                job_arg = mock_process_job.call_args[0][0]
-                assert job_arg.from_image == image_path
-
-        finally:
-            Path(image_path).unlink()
-
-    def test_video_generate_invalid_image_url(self, sample_config):
+        cli_mocks.process_job.return_value = sample_video_result
+
+        generate_video_command(
+            prompt="Animate this local image", from_image=fake_image_path
+        )
+
+        cli_mocks.process_job.assert_called_once()
+        job_arg = cli_mocks.process_job.call_args[0][0]
+        assert job_arg.from_image == fake_image_path
+
+    def test_video_generate_invalid_image_url(self, runner):
         """Test video generation with invalid source image URL."""
-        with patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config:
-            mock_load_config.return_value = sample_config
-
-            result = self.runner.invoke(
-                app,
-                [
-                    "video",
-                    "generate",
-                    "Animate image",
-                    "--from-image",
-                    "not-a-valid-url",
-                ],
-            )
-
-            assert result.exit_code == 1
-            assert "Error" in result.stdout
-            # The rich console might wrap the text, so we check for the parts
-            # of the message.
-            output_text = " ".join(result.stdout.strip().split())
-            assert "valid HTTP/HTTPS URL or an existing local file path" in output_text
-
-    def test_video_generate_keyboard_interrupt(self, sample_config):
+        result = runner.invoke(
+            app,
+            [
+                "video",
+                "generate",
+                "Animate image",
+                "--from-image",
+                "not-a-valid-url",
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "Error" in result.stdout
+        # The rich console might wrap the text, so we check for the parts
+        # of the message.
+        output_text = " ".join(result.stdout.strip().split())
+        assert "valid HTTP/HTTPS URL or an existing local file path" in output_text
+
+    def test_video_generate_keyboard_interrupt(self, runner, cli_mocks):
         """Test video generation interrupted by user."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.side_effect = KeyboardInterrupt()
-
-            result = self.runner.invoke(app, ["video", "generate", "Test video"])
-
-            assert result.exit_code == 1
-            assert "cancelled by user" in result.stdout
-
-    def test_video_generate_with_seed(self, sample_config, sample_video_result):
-        """Test video generation with seed parameter."""
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.return_value = sample_video_result
-
-            result = self.runner.invoke(
-                app,
-                [
-                    "video",
-                    "generate",
-                    "Consistent animation",
-                    "--seed",
-                    "42",
-                ],
-            )
-
-            assert result.exit_code == 0
-            mock_process_job.assert_called_once()
-            job_arg = mock_process_job.call_args[0][0]
-            assert job_arg.seed == 42
-
-    def test_video_generate_error_handling(self, sample_config):
-        """Test video generation error handling."""
-        from ymago.core.generation import GenerationError
-
-        with (
-            patch("ymago.cli.load_config", new_callable=AsyncMock) as mock_load_config,
-            patch(
-                "ymago.cli.process_generation_job", new_callable=AsyncMock
-            ) as mock_process_job,
-        ):
-            mock_load_config.return_value = sample_config
-            mock_process_job.side_effect = GenerationError("Video generation failed")
-
-            result = self.runner.invoke(app, ["video", "generate", "Test video"])
-
-            assert result.exit_code == 1
-            assert "Error" in result.stdout
-            assert "Video generation failed" in result.stdout
+        cli_mocks.process_job.side_effect = KeyboardInterrupt()
+
+        result = runner.invoke(app, ["video", "generate", "Test video"])
+
+        assert result.exit_code == 1
+        assert "cancelled by user" in result.stdout
+
+
+class TestGenerateCommandErrors:
+    """Test error reporting shared by the generate commands."""
+
+    @pytest.mark.parametrize(
+        ("args", "failing", "error", "expected"),
+        [
+            (
+                (*_IMAGE_GENERATE, "A test prompt"),
+                "load_config",
+                FileNotFoundError("No config found"),
+                "Error:",
+            ),
+            (
+                (*_IMAGE_GENERATE, "A test prompt"),
+                "process_job",
+                GenerationError("API quota exceeded"),
+                "API quota exceeded",
+            ),
+            (
+                (*_IMAGE_GENERATE, "A test prompt"),
+                "process_job",
+                StorageError("Permission denied"),
+                "Permission denied",
+            ),
+            (
+                (*_IMAGE_GENERATE, "A test prompt"),
+                "process_job",
+                Exception("Unexpected error"),
+                "Error:",
+            ),
+            pytest.param(
+                (*_IMAGE_GENERATE, "A test prompt", "--verbose"),
+                "process_job",
+                Exception("Unexpected error"),
+                "Traceback",
+                marks=pytest.mark.slow,  # Rich renders the full traceback
+            ),
+            (
+                (*_VIDEO_GENERATE, "Test video"),
+                "process_job",
+                GenerationError("Video generation failed"),
+                "Video generation failed",
+            ),
+        ],
+        ids=[
+            "image_config",
+            "image_generation",
+            "image_storage",
+            "image_unexpected",
+            "image_unexpected_verbose",
+            "video_generation",
+        ],
+    )
+    def test_generate_command_error(
+        self, runner, cli_mocks, args, failing, error, expected
+    ):
+        """Test that a failing generate command exits 1 and reports the error."""
+        getattr(cli_mocks, failing).side_effect = error
+
+        result = runner.invoke(app, args)
+
+        assert result.exit_code == 1
+        assert "Error:" in result.stdout
+        assert expected in result.stdout
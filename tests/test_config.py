@@ -81,7 +81,6 @@ class TestSettingsModel:
 class TestLoadConfig:
     """Test the load_config async function."""
 
-    @pytest.mark.asyncio
     async def test_load_config_from_current_directory_toml(self, mock_toml_config):
         """Test loading configuration from ./ymago.toml file."""
         with (
@@ -108,7 +107,6 @@ class TestLoadConfig:
             assert config.defaults.image_model == "gemini-2.5-flash-image-preview"
             assert str(config.defaults.output_path) == "/home/user/images"
 
-    @pytest.mark.asyncio
     async def test_load_config_from_home_directory_toml(self, mock_toml_config):
         """Test loading configuration from ~/.ymago.toml file."""
         with (
@@ -133,7 +131,6 @@ class TestLoadConfig:
 
             assert config.auth.google_api_key == "toml_api_key_67890"
 
-    @pytest.mark.asyncio
     async def test_load_config_environment_variable_override(self, mock_toml_config):
         """Test environment variables override TOML file values."""
         with (
@@ -171,7 +168,6 @@ class TestLoadConfig:
             assert str(config.defaults.output_path) == "/env/override/path"
             assert config.defaults.image_model == "env-override-model"
 
-    @pytest.mark.asyncio
     async def test_load_config_environment_only(self):
         """Test loading configuration from environment variables only."""
         with (
@@ -196,7 +192,6 @@ class TestLoadConfig:
             assert config.auth.google_api_key == "env_only_key"
             assert str(config.defaults.output_path) == "/env/only/path"
 
-    @pytest.mark.asyncio
     async def test_load_config_missing_configuration_raises_error(self):
         """Test FileNotFoundError when no config file or env vars exist."""
         with (
@@ -216,7 +211,6 @@ class TestLoadConfig:
             ):
                 await load_config()
 
-    @pytest.mark.asyncio
     async def test_load_config_invalid_toml_raises_error(self):
         """Test ValueError when TOML file is malformed."""
         with (
@@ -242,7 +236,6 @@ class TestLoadConfig:
             with pytest.raises(ValueError, match="Invalid TOML syntax"):
                 await load_config()
 
-    @pytest.mark.asyncio
     async def test_load_config_validation_error(self):
         """Test ValueError when configuration validation fails."""
         invalid_config = {"auth": {"google_api_key": ""}}  # Empty API key
@@ -187,7 +187,6 @@ class TestExtendedSettings:
 class TestConfigEnvironmentVariables:
     """Test configuration loading with environment variables."""
 
-    @pytest.mark.asyncio
     async def test_aws_env_vars(self):
         """Test loading AWS configuration from environment variables."""
         env_vars = {
@@ -204,7 +203,6 @@ class TestConfigEnvironmentVariables:
             assert config.cloud_storage.aws_secret_access_key == "secret123"
             assert config.cloud_storage.aws_region == "us-west-2"
 
-    @pytest.mark.asyncio
     async def test_gcp_env_vars(self):
         """Test loading GCP configuration from environment variables."""
         # Create a temporary service account file
@@ -227,7 +225,6 @@ class TestConfigEnvironmentVariables:
         finally:
             Path(tmp_path).unlink()
 
-    @pytest.mark.asyncio
     async def test_r2_env_vars(self):
         """Test loading R2 configuration from environment variables."""
         env_vars = {
@@ -244,7 +241,6 @@ class TestConfigEnvironmentVariables:
             assert config.cloud_storage.r2_access_key_id == "r2-access-key"
             assert config.cloud_storage.r2_secret_access_key == "r2-secret-key"
 
-    @pytest.mark.asyncio
     async def test_webhook_env_vars(self):
         """Test loading webhook configuration from environment variables."""
         env_vars = {
@@ -261,7 +257,6 @@ class TestConfigEnvironmentVariables:
             assert config.webhooks.timeout_seconds == 60
             assert config.webhooks.retry_attempts == 5
 
-    @pytest.mark.asyncio
     async def test_webhook_env_vars_false(self):
         """Test loading webhook configuration with false values."""
         env_vars = {"GOOGLE_API_KEY": "test-key", "YMAGO_WEBHOOK_ENABLED": "false"}
@@ -271,7 +266,6 @@ class TestConfigEnvironmentVariables:
 
             assert config.webhooks.enabled is False
 
-    @pytest.mark.asyncio
     async def test_invalid_webhook_env_vars(self):
         """Test loading webhook configuration with invalid environment values."""
         env_vars = {
@@ -7,6 +7,7 @@ including concurrency control, rate limiting, and checkpointing.
 
 import asyncio
 import json
+import os
 import tempfile
 import time
 from pathlib import Path
@@ -21,7 +22,7 @@ from ymago.models import BatchResult, GenerationRequest, GenerationResult
 class TestTokenBucketRateLimiter:
     """Test token bucket rate limiter implementation."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_rate_limiter_basic(self):
         """Test basic rate limiting functionality."""
         # 60 requests per minute = 1 per second
@@ -38,7 +39,6 @@ class TestTokenBucketRateLimiter:
         first_time = time.time() - start_time
         assert first_time >= 0.9  # Should wait ~1 second for new token
 
-    @pytest.mark.asyncio
     async def test_rate_limiter_burst(self):
         """Test burst capability of rate limiter."""
         # 600 requests per minute with burst capability
@@ -53,6 +53,67 @@ class TestTokenBucketRateLimiter:
         burst_time = time.time() - start_time
         assert burst_time < 0.5  # Burst should be fast
 
+    @pytest.mark.slow
+    async def test_rate_limiter_spacing_after_burst(self):
+        """Test waits after the burst are not shortened by earlier sleeps."""
+        # 600 requests per minute = 10 per second after a 60 token burst
+        limiter = TokenBucketRateLimiter(600)
+
+        for _ in range(int(limiter.bucket_size)):
+            await limiter.acquire()
+
+        start_time = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+
+        # Each post-burst acquire waits a full 0.1s token interval
+        assert time.monotonic() - start_time >= 0.29
+
+    async def test_rate_limiter_burst_skips_lock(self):
+        """Test acquires with tokens available never enter the lock."""
+        limiter = TokenBucketRateLimiter(600)
+        lock = MagicMock()
+        lock.__aenter__.side_effect = AssertionError("fast path took the lock")
+        limiter._lock = lock
+
+        for _ in range(5):
+            await limiter.acquire()
+
+        assert limiter.tokens < limiter.bucket_size
+
+    async def test_rate_limiter_serves_waiters_before_newcomers(self):
+        """Test a caller queued on the lock is not overtaken by a newcomer."""
+        limiter = TokenBucketRateLimiter(600)
+        order = []
+
+        async def take(name):
+            await limiter.acquire()
+            order.append(name)
+
+        # Hold the lock so the first caller has to queue on it
+        await limiter._lock.acquire()
+        queued = asyncio.create_task(take("queued"))
+        await asyncio.sleep(0)
+
+        # Release and acquire again before the queued task is rescheduled;
+        # tokens are available, so only the waiter count keeps the newcomer
+        # off the fast path
+        limiter._lock.release()
+        await take("newcomer")
+        await queued
+
+        assert order == ["queued", "newcomer"]
+
+    async def test_rate_limiter_has_no_background_task(self):
+        """Test the limiter refills from the clock without a producer task."""
+        tasks_before = asyncio.all_tasks()
+        limiter = TokenBucketRateLimiter(6000)
+
+        for _ in range(10):
+            await limiter.acquire()
+
+        assert asyncio.all_tasks() == tasks_before
+
     def test_rate_limiter_initialization(self):
         """Test rate limiter initialization."""
         limiter = TokenBucketRateLimiter(120)  # 120 requests per minute
@@ -86,7 +147,6 @@ class TestLocalExecutionBackendBatch:
             ),
         ]
 
-    @pytest.mark.asyncio
     async def test_load_checkpoint_empty(self, backend):
         """Test loading checkpoint from non-existent file."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -95,7 +155,6 @@ class TestLocalExecutionBackendBatch:
             completed = await backend._load_checkpoint(state_file)
             assert completed == set()
 
-    @pytest.mark.asyncio
     async def test_load_checkpoint_with_data(self, backend):
         """Test loading checkpoint with existing data."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -114,8 +173,9 @@ class TestLocalExecutionBackendBatch:
 
             completed = await backend._load_checkpoint(state_file)
             assert completed == {"req1", "req3"}  # Only successful requests
+            assert backend._loaded_success_ids == frozenset({"req1", "req3"})
+            assert backend._loaded_failed_ids == frozenset({"req2"})
 
-    @pytest.mark.asyncio
     async def test_load_checkpoint_invalid_json(self, backend):
         """Test loading checkpoint with invalid JSON lines."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -125,12 +185,12 @@ class TestLocalExecutionBackendBatch:
             with open(state_file, "w") as f:
                 f.write('{"request_id": "req1", "status": "success"}\n')
                 f.write("invalid json line\n")
+                f.write("[1, 2, 3]\n")
                 f.write('{"request_id": "req2", "status": "success"}\n')
 
             completed = await backend._load_checkpoint(state_file)
             assert completed == {"req1", "req2"}  # Should skip invalid line
 
-    @pytest.mark.asyncio
     async def test_write_checkpoint(self, backend):
         """Test writing checkpoint data."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -155,7 +215,21 @@ class TestLocalExecutionBackendBatch:
                 assert data["status"] == "success"
                 assert data["output_path"] == "/test/path"
 
-    @pytest.mark.asyncio
+    def test_encode_checkpoint_line_matches_model_dump(self):
+        """Test checkpoint lines are the model's JSON plus a newline."""
+        from ymago.core.backends import _encode_checkpoint_line
+
+        result = BatchResult(
+            request_id="req1",
+            status="success",
+            output_path="/path1",
+            metadata={"model": "test-model"},
+        )
+
+        line = _encode_checkpoint_line(result)
+
+        assert line == result.model_dump_json().encode() + b"\n"
+
     async def test_process_request_with_retry_success(self, backend):
         """Test successful request processing with retry logic."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -188,7 +262,6 @@ class TestLocalExecutionBackendBatch:
                     assert result.output_path == str(mock_result.local_path)
                     assert result.file_size_bytes == 1024
 
-    @pytest.mark.asyncio
     async def test_process_request_with_retry_failure(self, backend):
         """Test request processing failure handling."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -214,7 +287,6 @@ class TestLocalExecutionBackendBatch:
                     assert "Test error" in result.error_message
                     assert result.processing_time_seconds > 0
 
-    @pytest.mark.asyncio
     async def test_process_batch_basic(self, backend, sample_requests):
         """Test basic batch processing functionality."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -254,7 +326,6 @@ class TestLocalExecutionBackendBatch:
                 assert summary.processing_time_seconds > 0
                 assert summary.throughput_requests_per_minute > 0
 
-    @pytest.mark.asyncio
     async def test_process_batch_with_resume(self, backend, sample_requests):
         """Test batch processing with resume functionality."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -300,7 +371,7 @@ class TestLocalExecutionBackendBatch:
                 assert summary.failed == 0
                 assert summary.skipped == 1  # req1 was skipped (already completed)
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_process_batch_concurrency_control(self, backend):
         """Test that concurrency is properly controlled."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -350,7 +421,6 @@ class TestLocalExecutionBackendBatch:
                 # Should never exceed the concurrency limit
                 assert max_concurrent <= 2
 
-    @pytest.mark.asyncio
     async def test_process_batch_empty_requests(self, backend):
         """Test batch processing with no requests."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -372,3 +442,108 @@ class TestLocalExecutionBackendBatch:
             assert summary.successful == 0
             assert summary.failed == 0
             assert summary.skipped == 0
+
+    async def test_process_batch_batches_checkpoint_writes(self, backend):
+        """Test that checkpoint lines are flushed in batches during a run."""
+        from ymago.core.backends import _CheckpointBatcher
+
+        num_requests = 120
+        write_calls = 0
+        real_write_all = _CheckpointBatcher._write_all
+
+        def counting_write_all(fd, chunks):
+            nonlocal write_calls
+            write_calls += 1
+            real_write_all(fd, chunks)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+
+            async def request_generator():
+                for i in range(num_requests):
+                    yield GenerationRequest(id=f"req{i}", prompt=f"Prompt {i}")
+
+            async def mock_process(request, output_dir, state_file):
+                result = BatchResult(
+                    request_id=request.id, status="success", output_path="/path"
+                )
+                await backend._write_checkpoint(state_file, result)
+                return result
+
+            with (
+                patch.object(
+                    backend, "_process_request_with_retry", side_effect=mock_process
+                ),
+                patch.object(
+                    _CheckpointBatcher,
+                    "_write_all",
+                    staticmethod(counting_write_all),
+                ),
+            ):
+                summary = await backend.process_batch(
+                    requests=request_generator(),
+                    output_dir=output_dir,
+                    concurrency=10,
+                    rate_limit=6000,
+                    resume=False,
+                )
+
+            # Every line is on disk once process_batch returns
+            with open(summary.results_log_path) as f:
+                ids = {json.loads(line)["request_id"] for line in f}
+            assert ids == {f"req{i}" for i in range(num_requests)}
+            assert 0 < write_calls < num_requests
+
+    @pytest.mark.parametrize("has_writev", [True, False], ids=["writev", "write"])
+    def test_checkpoint_write_all_appends_lines(self, has_writev, tmp_path):
+        """Test batched lines are appended in order with and without writev."""
+        import ymago.core.backends as backends_module
+        from ymago.core.backends import _CheckpointBatcher
+
+        state_file = tmp_path / "state.jsonl"
+        state_file.write_bytes(b"existing\n")
+        chunks = [f"line{i}\n".encode() for i in range(5)]
+
+        fd = os.open(state_file, os.O_WRONLY | os.O_APPEND)
+        try:
+            with patch.object(backends_module, "_HAS_WRITEV", has_writev):
+                _CheckpointBatcher._write_all(fd, chunks)
+        finally:
+            os.close(fd)
+
+        assert state_file.read_bytes() == b"existing\n" + b"".join(chunks)
+
+    @pytest.mark.slow
+    async def test_process_batch_streams_requests(self, backend):
+        """Test requests are pulled from the generator only as slots free up."""
+        concurrency = 2
+        finished = 0
+        max_ahead = 0
+
+        async def request_generator():
+            nonlocal max_ahead
+            for i in range(20):
+                max_ahead = max(max_ahead, i - finished)
+                yield GenerationRequest(id=f"req{i}", prompt=f"Prompt {i}")
+
+        async def mock_process(request, output_dir, state_file):
+            nonlocal finished
+            await asyncio.sleep(0.01)
+            finished += 1
+            return BatchResult(request_id=request.id, status="success")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.object(
+                backend, "_process_request_with_retry", side_effect=mock_process
+            ):
+                summary = await backend.process_batch(
+                    requests=request_generator(),
+                    output_dir=Path(temp_dir),
+                    concurrency=concurrency,
+                    rate_limit=6000,
+                    resume=False,
+                )
+
+        assert summary.successful == 20
+        # Never more than `concurrency` requests in flight ahead of completions
+        assert max_ahead <= concurrency
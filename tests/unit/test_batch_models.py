@@ -111,6 +111,13 @@ class TestGenerationRequest:
         errors = exc_info.value.errors()
         assert any("aspect_ratio" in str(error).lower() for error in errors)
 
+    def test_generation_request_is_immutable(self):
+        """Test that requests cannot be modified after creation."""
+        request = GenerationRequest(id="req", prompt="A sunset")
+
+        with pytest.raises(ValidationError):
+            request.prompt = "A sunrise"
+
     def test_generation_request_to_generation_job(self):
         """Test conversion to GenerationJob."""
         request = GenerationRequest(
@@ -203,6 +210,13 @@ class TestBatchResult:
         with pytest.raises(ValidationError):
             BatchResult(request_id="req", status="success", file_size_bytes=-100)
 
+    def test_batch_result_is_immutable(self):
+        """Test that results cannot be modified after creation."""
+        result = BatchResult(request_id="req", status="success")
+
+        with pytest.raises(ValidationError):
+            result.status = "failure"
+
     def test_batch_result_with_metadata(self):
         """Test BatchResult with metadata."""
         metadata = {"model": "test-model", "version": "1.0"}
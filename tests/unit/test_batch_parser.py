@@ -215,7 +215,6 @@ class TestValidationErrorFormatting:
             assert ";" in formatted  # Multiple errors separated by semicolon
 
 
-@pytest.mark.asyncio
 class TestParseBatchInput:
     """Test the main parse_batch_input function."""
 